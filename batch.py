@@ -0,0 +1,240 @@
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from src.arpa_ import ARPATransliteration
+from src.gc_ import GlyphCorrection
+from src.mt_ import MTransliteration
+from src.shared_ import SharedCache
+from run import convert_file
+
+# Engines (simple mode functions of run()), created once per worker process
+engines: Dict[str, Callable[[], Callable]] = {
+    "mt": lambda: MTransliteration().transliterate_words,
+    "gc": lambda: GlyphCorrection().correct_words,
+    # CMUdict-format lexicons to word<TAB>word_mm
+    "arpa": lambda: ARPATransliteration().transliterate_lexicon,
+}
+_func: Callable | None = None
+_encoding = "utf-8"
+
+
+def collect_files(
+    source: str | Path, pattern: str = "*.txt"
+) -> Tuple[Path, List[Path]]:
+    """Input files of a directory (matching `pattern`, recursively) or of a
+    manifest listing one path per line (relative to the manifest).
+
+    Returns the base directory (outputs mirror the paths relative to it) and
+    the sorted files.
+    """
+    source = Path(source)
+    if source.is_dir():
+        return source, sorted(file for file in source.rglob(pattern) if file.is_file())
+    base = source.parent
+    lines = source.read_text(encoding="utf-8").split("\n")
+    return base, sorted(base / line.strip() for line in lines if line.strip())
+
+
+class Checkpoint:
+    """
+    Append-only manifest (JSON lines) of the files that are completely done.
+
+    A file is skipped on restart when its entry matches the current size and
+    modification time of the input and its output exists. Entries are synced
+    to disk one by one, so a crash loses at most the file in progress.
+    """
+
+    def __init__(self, file: str | Path) -> None:
+        self.file = Path(file)
+        self.entries: Dict[str, Dict] = {}
+        if self.file.exists():
+            for line in self.file.read_text(encoding="utf-8").split("\n"):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # empty or partially written last line
+                self.entries[entry["file"]] = entry
+
+    def is_done(self, name: str, input_file: Path, output_file: Path) -> bool:
+        entry = self.entries.get(name)
+        if entry is None or not output_file.exists():
+            return False
+        stat = input_file.stat()
+        return entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+
+    def record(self, entry: Dict) -> None:
+        self.entries[entry["file"]] = entry
+        with self.file.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class Progress:
+    """Throughput and ETA (by bytes) of a batch, printed after every file."""
+
+    def __init__(self, num_files: int, num_bytes: int) -> None:
+        self.num_files, self.num_bytes = num_files, num_bytes
+        self.done_files, self.done_bytes, self.done_lines = 0, 0, 0
+        self.start = time.perf_counter()
+
+    def update(self, name: str, size: int, num_lines: int) -> None:
+        self.done_files += 1
+        self.done_bytes += size
+        self.done_lines += num_lines
+        elapsed = time.perf_counter() - self.start
+        rate = self.done_bytes / elapsed if elapsed else 0.0
+        eta = (self.num_bytes - self.done_bytes) / rate if rate else 0.0
+        print(
+            f"[{self.done_files}/{self.num_files}] {name} | "
+            f"{self.done_lines / elapsed:,.0f} lines/s | {rate / 1e6:.2f} MB/s | "
+            f"ETA {time.strftime('%H:%M:%S', time.gmtime(eta))}",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+def init_worker(
+    engine: str,
+    cache_name: str | None = None,
+    encoding: str = "utf-8",
+    cache: SharedCache | None = None,
+) -> None:
+    """Set up the engine of a worker. Workers attach to the shared cache by
+    name; a serial run in the parent passes the owner's `cache` instead."""
+    global _func, _encoding
+    _encoding = encoding
+    if cache is None and cache_name is not None:
+        cache = SharedCache(cache_name)
+    if cache is not None:
+        # Word cache shared by all workers (mt engine)
+        _func = MTransliteration(cache=cache).transliterate_words
+    else:
+        _func = engines[engine]()
+
+
+def process_file(task: Tuple[str, Path, Path]) -> Dict:
+    """Convert one file atomically (worker side) and return its checkpoint entry."""
+    name, input_file, output_file = task
+    stat = input_file.stat()
+    start = time.perf_counter()
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    num_lines = convert_file(
+        _func, input_file, output_file, atomic=True, encoding=_encoding
+    )
+    return {
+        "file": name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "lines": num_lines,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def run_batch(
+    source: str | Path,
+    output_dir: str | Path,
+    engine: str = "mt",
+    pattern: str = "*.txt",
+    jobs: int = 1,
+    checkpoint_file: str | Path | None = None,
+    shared_cache: int = 0,
+    encoding: str = "utf-8",
+) -> int:
+    """Convert every input file into `output_dir`, skipping finished files.
+
+    With `shared_cache` (number of slots, mt engine only), the workers share
+    one word cache in shared memory instead of warming their own. Inputs are
+    read with `encoding` (e.g. latin-1 for cmudict-0.7b with the arpa engine),
+    outputs are written in UTF-8.
+
+    Returns the number of files converted in this run.
+    """
+    if shared_cache and engine != "mt":
+        raise ValueError("The shared word cache is only used by the mt engine.")
+    base, files = collect_files(source, pattern)
+    output_dir = Path(output_dir)
+    # Never pick up earlier outputs when writing inside the source directory
+    files = [
+        file for file in files if output_dir.resolve() not in file.resolve().parents
+    ]
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = Checkpoint(checkpoint_file or output_dir / "checkpoint.jsonl")
+
+    tasks = []
+    for input_file in files:
+        name = input_file.relative_to(base).as_posix()
+        output_file = output_dir / name
+        if not checkpoint.is_done(name, input_file, output_file):
+            tasks.append((name, input_file, output_file))
+    print(
+        f"{len(files)} files, {len(files) - len(tasks)} done, {len(tasks)} to run",
+        file=sys.stderr,
+    )
+    if not tasks:
+        return 0
+
+    progress = Progress(len(tasks), sum(task[1].stat().st_size for task in tasks))
+    cache = SharedCache.create(capacity=shared_cache) if shared_cache else None
+    if jobs <= 1:
+        init_worker(engine, encoding=encoding, cache=cache)
+        results = map(process_file, tasks)
+    else:
+        initargs = (engine, cache.name if cache is not None else None, encoding)
+        pool = Pool(jobs, initializer=init_worker, initargs=initargs)
+        results = pool.imap_unordered(process_file, tasks)
+    try:
+        for entry in results:
+            checkpoint.record(entry)
+            progress.update(entry["file"], entry["size"], entry["lines"])
+    finally:
+        if jobs > 1:
+            pool.terminate()
+            pool.join()
+        if cache is not None:
+            cache.close()
+    return len(tasks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resumable multi-file batch runner")
+    parser.add_argument("source", help="Input directory or manifest of input files")
+    parser.add_argument("output_dir", help="Output directory (mirrors the inputs)")
+    parser.add_argument("--engine", choices=sorted(engines), default="mt")
+    parser.add_argument("--pattern", default="*.txt", help="Input files of a directory")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes")
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint manifest (default: output_dir/checkpoint.jsonl)",
+    )
+    parser.add_argument(
+        "--shared-cache",
+        type=int,
+        default=0,
+        metavar="SLOTS",
+        help="Share one word cache of SLOTS entries across the workers (mt engine)",
+    )
+    parser.add_argument(
+        "--encoding",
+        default="utf-8",
+        help="Encoding of the inputs (e.g. latin-1 for cmudict-0.7b, arpa engine)",
+    )
+
+    args = parser.parse_args()
+
+    run_batch(
+        args.source,
+        args.output_dir,
+        engine=args.engine,
+        pattern=args.pattern,
+        jobs=args.jobs,
+        checkpoint_file=args.checkpoint,
+        shared_cache=args.shared_cache,
+        encoding=args.encoding,
+    )
@@ -0,0 +1,767 @@
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from src.lon_.bulk import BulkCleaner
+from src.lon_.cleaner import Cleaner
+from src.gc_.correction import Correction
+from src.gc_.u2b import U2B
+from src.lon_ import BN, PhonemeInventory
+from src.mt_ import (
+    MTransliteration,
+    PhonemeConvertor,
+    Syllabification,
+    Spelling,
+    SuffixCache,
+)
+from src.mt_.cache import SUFFIXES
+from src.mt_base_ import Baseline, BaselineExtended
+from src.mt_base_.transducer import Transducer
+from src.shared_ import SharedCache
+from utils import read_list
+
+history_file = Path("data/bench_/history.json")
+# Word lists (first column) to check the compiled baseline rules against
+transducer_files = [
+    "data/transcribed.txt",
+    "data/corrected.txt",
+    "data/corpus/literature_corpus/words.txt",
+]
+# Rule sets (and a text) on which a single scan once differed from the
+# sequential replacements: a multi-character deletion joins its neighbours
+transducer_regressions = [
+    ([("bc", ""), ("ba", "d")], "xybccbbca"),
+]
+import_statements = [
+    "from src.mt_ import MTransliteration",
+    "from src.gc_ import GlyphCorrection",
+]
+worker_counts = [1, 2, 4, 8, 16]
+# Word lists to check the batch syllabifier and the bulk cleaner against
+syllabify_files = [
+    "data/transcribed.txt",
+    "data/corpus/literature_corpus/words.txt",
+]
+# Words the suffix cache once composed differently from the pipeline
+suffix_regressions = ["এন্দ্শিংসু"]
+# Only needed for plotting, evaluation and progress bars
+heavy_modules = ["matplotlib", "numpy", "enchant", "tqdm"]
+
+
+# Samples
+def load_samples(
+    size: int = 500,
+    seed: int = 0,
+) -> Tuple[List[str], List[str], List[str]]:
+    """Draw fixed word samples (Bengali, Meetei Mayek, s550) from the bundled data."""
+    rng = random.Random(seed)
+    transcribed = read_list("data/transcribed.txt")
+    corrected = read_list("data/corrected.txt")
+    pairs = [line.split("\t") for line in rng.sample(transcribed, size)]
+    words_bn = [word_bn for word_bn, _, _ in pairs]
+    words_mm = [word_mm for _, word_mm, _ in pairs]
+    words_s550 = [line.split("\t")[0] for line in rng.sample(corrected, size)]
+    return words_bn, words_mm, words_s550
+
+
+def prepare_components(
+    words_bn: List[str],
+    words_mm: List[str],
+    words_s550: List[str],
+) -> Dict[str, Tuple[Callable, List[tuple]]]:
+    """Build (function, argument list) pairs for every benchmarked component.
+
+    Each stage is fed with the output of the previous stage so that the
+    inputs match what the stage sees inside the full pipeline.
+    """
+    pc = PhonemeConvertor()
+    syllabification = Syllabification()
+    spelling = Spelling()
+    correction = Correction()
+
+    cleaned = [Cleaner.deepclean_bn_utf(word) for word in words_bn]
+    cleaned = [word for word in cleaned if word.strip()]
+    seqs = [pc.extract_seq(word) for word in cleaned]
+    split_args = [(char_seq, phoneme_seq) for phoneme_seq, char_seq in seqs]
+    word_phonemes = []
+    for char_seq, phoneme_seq in split_args:
+        split_tags = syllabification.get_split_tags(char_seq, phoneme_seq)
+        syl_chars = pc.split_seq_by_bool(char_seq, split_tags)
+        word_phonemes.append(
+            [pc.prepare_syllable_phoneme(syllable) for syllable in syl_chars]
+        )
+    sup_phonemes = [pc.split_more(phonemes) for phonemes in word_phonemes]
+
+    # Glyph correction stages (name mangled private methods)
+    adjust_glyph = correction._Correction__adjust_glyph
+    map_unicode = correction._Correction__map_unicode
+    fix_r_glyph = correction._Correction__fix_r_glyph
+    fix_vowels = correction._Correction__fix_vowels
+    adjusted = [adjust_glyph(word, U2B.premap) for word in words_s550]
+    mapped = [map_unicode(word, U2B.charmap, U2B.sorted_keys) for word in adjusted]
+    fixed_r = [fix_r_glyph(word, U2B.s550_extra_chars, U2B.R_char_r) for word in mapped]
+
+    return {
+        "Cleaner.deepclean_bn_utf": (
+            Cleaner.deepclean_bn_utf,
+            [(word,) for word in words_bn],
+        ),
+        "Cleaner.clean_mm_utf": (Cleaner.clean_mm_utf, [(word,) for word in words_mm]),
+        "PhonemeConvertor.extract_seq": (pc.extract_seq, [(word,) for word in cleaned]),
+        "PhonemeConvertor.split_more": (
+            pc.split_more,
+            [(phonemes,) for phonemes in word_phonemes],
+        ),
+        "Syllabification.get_split_tags": (
+            syllabification.get_split_tags,
+            split_args,
+        ),
+        "Spelling.spell": (spelling.spell, [(phonemes,) for phonemes in sup_phonemes]),
+        "Correction.__adjust_glyph": (
+            adjust_glyph,
+            [(word, U2B.premap) for word in words_s550],
+        ),
+        "Correction.__map_unicode": (
+            map_unicode,
+            [(word, U2B.charmap, U2B.sorted_keys) for word in adjusted],
+        ),
+        "Correction.__fix_r_glyph": (
+            fix_r_glyph,
+            [(word, U2B.s550_extra_chars, U2B.R_char_r) for word in mapped],
+        ),
+        "Correction.__fix_vowels": (
+            fix_vowels,
+            [(word, BN.L_vowels) for word in fixed_r],
+        ),
+    }
+
+
+# Measurement
+def measure(func: Callable, args_list: List[tuple], repeat: int) -> List[float]:
+    """Time `repeat` passes over the samples and return nanoseconds per call."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for args in args_list:
+            func(*args)
+        timings.append((time.perf_counter_ns() - start) / len(args_list))
+    return timings
+
+
+def bench(
+    repeat: int = 20,
+    size: int = 500,
+    seed: int = 0,
+) -> Dict[str, Dict]:
+    """Run every component benchmark and summarise the timings."""
+    components = prepare_components(*load_samples(size=size, seed=seed))
+    results = {}
+    for name, (func, args_list) in components.items():
+        measure(func, args_list, repeat=1)  # Warm up
+        samples = measure(func, args_list, repeat=repeat)
+        results[name] = {
+            "samples": samples,
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "min": min(samples),
+        }
+        print(
+            f"{name:<34} {results[name]['mean']:>12.1f} ns/call "
+            f"± {results[name]['stdev']:.1f}"
+        )
+    return results
+
+
+# History
+def get_commit() -> str:
+    """Current git commit (short hash), suffixed with -dirty for local changes."""
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
+    dirty = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    return f"{commit}-dirty" if dirty else commit
+
+
+def load_history(file: str | Path = history_file) -> Dict[str, Dict]:
+    file = Path(file)
+    return json.loads(file.read_text(encoding="utf-8")) if file.exists() else {}
+
+
+def save_history(
+    commit: str,
+    results: Dict[str, Dict],
+    file: str | Path = history_file,
+    size: int = 500,
+    seed: int = 0,
+) -> None:
+    """Store the results of `commit` in the JSON history (overwrites the old entry)."""
+    file = Path(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    history = load_history(file)
+    history[commit] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "size": size,
+        "seed": seed,
+        "results": results,
+    }
+    file.write_text(json.dumps(history, indent=1), encoding="utf-8")
+
+
+# Comparison
+def welch_test(old: List[float], new: List[float]) -> Tuple[float, float]:
+    """Welch's t statistic and one-sided p-value for `new` being slower than `old`.
+
+    The p-value uses the normal approximation of the t distribution, which is
+    adequate for the usual number of repeats (>= 10 per commit).
+    """
+    var_old = statistics.variance(old) if len(old) > 1 else 0.0
+    var_new = statistics.variance(new) if len(new) > 1 else 0.0
+    se = math.sqrt(var_old / len(old) + var_new / len(new))
+    if se == 0:
+        return 0.0, 1.0
+    t = (statistics.fmean(new) - statistics.fmean(old)) / se
+    p = 0.5 * math.erfc(t / math.sqrt(2))
+    return t, p
+
+
+def compare(
+    commit_old: str,
+    commit_new: str,
+    file: str | Path = history_file,
+    alpha: float = 0.01,
+    min_change: float = 0.05,
+) -> List[str]:
+    """Compare two commits and return the components with significant slowdowns.
+
+    A component is flagged when the one-sided Welch test is significant at
+    `alpha` and the mean got slower by at least `min_change` (relative).
+    """
+    history = load_history(file)
+    for commit in (commit_old, commit_new):
+        if commit not in history:
+            raise KeyError(f"No benchmark results for commit {commit} in {file}")
+    results_old = history[commit_old]["results"]
+    results_new = history[commit_new]["results"]
+
+    slowdowns = []
+    print(f"Comparison: {commit_old} --> {commit_new}")
+    print(f"{'component':<34} {'old ns':>10} {'new ns':>10} {'change':>8} {'p':>8}")
+    for name in (name for name in results_old if name in results_new):
+        old, new = results_old[name], results_new[name]
+        change = new["mean"] / old["mean"] - 1
+        _, p = welch_test(old["samples"], new["samples"])
+        flag = p < alpha and change >= min_change
+        if flag:
+            slowdowns.append(name)
+        print(
+            f"{name:<34} {old['mean']:>10.1f} {new['mean']:>10.1f} "
+            f"{change*100:>+7.1f}% {p:>8.4f}{'  SLOWER' if flag else ''}"
+        )
+    return slowdowns
+
+
+# Import time
+def measure_import(statement: str, repeat: int = 5) -> Tuple[float, List[str]]:
+    """Cold import time (ms, best of `repeat` fresh interpreters) and top-level
+    packages imported by `statement`, measured with `python -X importtime`."""
+    best, modules = math.inf, set()
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total = 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, _, name = line[len("import time:") :].split("|")
+            total += int(self_us)
+            modules.add(name.strip().split(".")[0])
+        best = min(best, total / 1e3)
+    return best, sorted(modules)
+
+
+def check_import_time(budget: float = 100.0, repeat: int = 5) -> List[str]:
+    """Check the core entry points against an import time budget (ms).
+
+    Returns the failures: statements over budget or importing any of
+    `heavy_modules`.
+    """
+    failures = []
+    for statement in import_statements:
+        elapsed, modules = measure_import(statement, repeat=repeat)
+        heavy = [module for module in heavy_modules if module in modules]
+        ok = elapsed <= budget and not heavy
+        print(
+            f"{statement:<40} {elapsed:>8.1f} ms"
+            f"{'' if ok else '  FAILED'}{'  imports ' + ', '.join(heavy) if heavy else ''}"
+        )
+        if not ok:
+            failures.append(statement)
+    return failures
+
+
+# Baseline transducers
+def check_transducers(files: List[str] = transducer_files) -> int:
+    """Check the compiled rules of both baselines against the sequential
+    replacements on every word of `files` and time both.
+
+    Returns the number of mismatches.
+    """
+    words = [line.split("\t")[0] for file in files for line in read_list(file)]
+    mismatches = 0
+    for name, model in (
+        ("Baseline", Baseline()),
+        ("BaselineExtended", BaselineExtended()),
+    ):
+        transducer = model.transducer
+        timings = {}
+        for func in (transducer.apply_sequential, transducer.apply):
+            start = time.perf_counter()
+            outputs = [func(word) for word in words]
+            timings[func.__name__] = (time.perf_counter() - start, outputs)
+        (old, expected), (new, outputs) = timings.values()
+        failed = sum(a != b for a, b in zip(expected, outputs))
+        mismatches += failed
+        print(
+            f"{name:<18} {len(transducer.passes)} passes | "
+            f"{len(words) / old:>10,.0f} -> {len(words) / new:>10,.0f} words/s | "
+            f"{failed} mismatches"
+        )
+    return mismatches + check_transducer_rules()
+
+
+def check_transducer_rules(size: int = 5000, seed: int = 0) -> int:
+    """Check the compiled passes of `transducer_regressions` and of `size`
+    random rule sets over a small alphabet (deletions included) against the
+    sequential replacements.
+
+    Returns the number of mismatching rule sets.
+    """
+    rng = random.Random(seed)
+    cases = [(rules, [text]) for rules, text in transducer_regressions]
+    for _ in range(size):
+        rules = [
+            (
+                "".join(rng.choices("abcd", k=rng.randint(1, 3))),
+                "".join(rng.choices("abcdxy", k=rng.randint(0, 2))),
+            )
+            for _ in range(rng.randint(1, 6))
+        ]
+        texts = ["".join(rng.choices("abcd", k=rng.randint(0, 12))) for _ in range(20)]
+        cases.append((rules, texts))
+    failed = 0
+    for rules, texts in cases:
+        transducer = Transducer(rules)
+        if any(
+            transducer.apply(text) != transducer.apply_sequential(text)
+            for text in texts
+        ):
+            failed += 1
+    print(f"{'Random rule sets':<18} {len(cases)} rule sets | {failed} mismatches")
+    return failed
+
+
+# Batch syllabification
+def check_batch_syllabification(
+    files: List[str] = syllabify_files, batch_size: int = 100000
+) -> int:
+    """Check BatchSyllabification against Syllabification.get_split_tags on
+    every word of `files` and time both.
+
+    Returns the number of mismatches.
+    """
+    from src.mt_ import BatchSyllabification
+
+    pc = PhonemeConvertor()
+    syllabification = Syllabification()
+    batch = BatchSyllabification()
+    char_seqs, phoneme_seqs = [], []
+    for line in (line for file in files for line in read_list(file)):
+        word = line.split("\t")[0].strip()
+        phoneme_seq, char_seq = pc.extract_seq(Cleaner.deepclean_bn_utf(word))
+        char_seqs.append(char_seq)
+        phoneme_seqs.append(phoneme_seq)
+
+    start = time.perf_counter()
+    expected = [
+        syllabification.get_split_tags(char_seq, phoneme_seq)
+        for char_seq, phoneme_seq in zip(char_seqs, phoneme_seqs)
+    ]
+    old = time.perf_counter() - start
+    start = time.perf_counter()
+    outputs = []
+    for i in range(0, len(char_seqs), batch_size):
+        outputs += batch.get_split_tags(
+            char_seqs[i : i + batch_size], phoneme_seqs[i : i + batch_size]
+        )
+    new = time.perf_counter() - start
+    mismatches = sum(a != b for a, b in zip(expected, outputs))
+    print(
+        f"{len(char_seqs)} words | {len(char_seqs) / old:>10,.0f} -> "
+        f"{len(char_seqs) / new:>10,.0f} words/s | {mismatches} mismatches"
+    )
+    return mismatches
+
+
+# Bulk normalization
+def check_bulk_cleaner(files: List[str] = syllabify_files) -> int:
+    """Check every BulkCleaner method against the per-word Cleaner method on
+    the Bengali words (first column) and Meetei Mayek words (second column)
+    of `files`, and time both.
+
+    Returns the number of mismatches.
+    """
+    columns = [[], []]
+    for line in (line for file in files for line in read_list(file)):
+        for column, word in zip(columns, line.split("\t")):
+            column.append(word)
+    words_bn, words_mm = columns
+
+    mismatches = 0
+    for name, words in (
+        ("filter_bn_utf", words_bn),
+        ("clean_bn_utf", words_bn),
+        ("deepclean_bn_utf", words_bn),
+        ("filter_mm_utf", words_mm),
+        ("clean_mm_utf", words_mm),
+        ("deepclean_mm_utf", words_mm),
+        ("clean_transcribed_utf", words_mm),
+    ):
+        func, bulk_func = getattr(Cleaner, name), getattr(BulkCleaner, name)
+        start = time.perf_counter()
+        expected = [func(word) for word in words]
+        old = time.perf_counter() - start
+        start = time.perf_counter()
+        outputs = BulkCleaner.clean_words(bulk_func, words)
+        new = time.perf_counter() - start
+        failed = sum(a != b for a, b in zip(expected, outputs))
+        mismatches += failed
+        print(
+            f"{name:<22} {len(words) / old:>10,.0f} -> "
+            f"{len(words) / new:>10,.0f} words/s | {failed} mismatches"
+        )
+    return mismatches
+
+
+# SSP analytics
+def ssp_reference(words: List[str], parker: bool = False, max_position: int = 8):
+    """SSPAnalytics statistics computed word by word with Cleaner,
+    Syllabification.get_split_tags and PhonemeInventory.get_sonority.
+
+    Returns (counts, contours, violations, positions, offsets).
+    """
+    import numpy as np
+
+    from src.mt_.ssp import CONTOUR_LENGTH
+
+    pi = PhonemeInventory.shared()
+    pc, syllabification = PhonemeConvertor(pi=pi), Syllabification()
+    vowel = max(
+        pi.get_sonority(phoneme, parker=parker) for phoneme in pi.phoneme_set_all
+    )
+    last = max_position - 1
+    counts = dict.fromkeys(
+        ["words", "skipped", "syllables", "phonemes", "violating_syllables"], 0
+    )
+    contours, violations = Counter(), Counter()
+    positions = np.zeros((max_position, vowel + 1), dtype=np.int64)
+    offsets = np.zeros((2 * max_position - 1, vowel + 1), dtype=np.int64)
+    for word in words:
+        word = Cleaner.deepclean_bn_utf(word)
+        if not word:
+            counts["skipped"] += 1
+            continue
+        counts["words"] += 1
+        phoneme_seq, char_seq = pc.extract_seq(word)
+        tags = syllabification.get_split_tags(char_seq, phoneme_seq)
+        syllables = [[]]
+        for i, phoneme in enumerate(phoneme_seq):
+            if i and tags[i - 1]:
+                syllables.append([])
+            sonority = pi.get_sonority(phoneme, parker=parker)
+            if sonority >= 0:
+                syllables[-1].append((phoneme, sonority))
+        for syllable in filter(None, syllables):
+            phonemes, values = zip(*syllable)
+            peak = values.index(max(values))
+            counts["syllables"] += 1
+            counts["phonemes"] += len(values)
+            contours[values[:CONTOUR_LENGTH]] += 1
+            violating = False
+            for i in range(1, len(values)):
+                if values[i - 1] >= vowel or values[i] >= vowel:
+                    continue
+                if i <= peak and values[i - 1] >= values[i]:
+                    side = "onset"
+                elif i - 1 >= peak and values[i - 1] <= values[i]:
+                    side = "coda"
+                else:
+                    continue
+                violations[(phonemes[i - 1], phonemes[i], side)] += 1
+                violating = True
+            counts["violating_syllables"] += violating
+            for position, sonority in enumerate(values):
+                positions[min(position, last), sonority] += 1
+                offset = min(max(position - peak, -last), last) + last
+                offsets[offset, sonority] += 1
+    return counts, contours, violations, positions, offsets
+
+
+def check_ssp(files: List[str] = syllabify_files) -> int:
+    """Check SSPAnalytics against `ssp_reference` on the Bengali words (first
+    column) of `files`, for both sonority scales, and time both.
+
+    Returns the number of mismatching statistics.
+    """
+    from src.mt_ import SSPAnalytics
+
+    words = [line.split("\t")[0].strip() for file in files for line in read_list(file)]
+    mismatches = 0
+    for parker in (False, True):
+        start = time.perf_counter()
+        counts, contours, violations, positions, offsets = ssp_reference(
+            words, parker=parker
+        )
+        old = time.perf_counter() - start
+        start = time.perf_counter()
+        ssp = SSPAnalytics(parker=parker)
+        ssp.update(words)
+        new = time.perf_counter() - start
+        summary = ssp.summary()
+        failed = [name for name, count in counts.items() if summary[name] != count]
+        failed += [
+            name
+            for name, equal in (
+                ("contours", ssp.contours == contours),
+                ("violations", ssp.violations == violations),
+                ("positions", (summary["positions"] == positions).all()),
+                ("offsets", (summary["offsets"] == offsets).all()),
+            )
+            if not equal
+        ]
+        mismatches += len(failed)
+        print(
+            f"{summary['scale']:<8} {len(words) / old:>8,.0f} -> "
+            f"{len(words) / new:>8,.0f} words/s | {len(contours)} contours | "
+            f"{len(failed)} mismatches{': ' + ', '.join(failed) if failed else ''}"
+        )
+    return mismatches
+
+
+# Suffix cache
+def check_suffix_cache(
+    files: List[str] = syllabify_files, size: int = 100000, seed: int = 0
+) -> int:
+    """Check SuffixCache against the pipeline on `suffix_regressions`, every
+    word of `files` and `size` random stems (word prefixes) + suffixes, and
+    time both.
+
+    Returns the number of mismatches.
+    """
+    rng = random.Random(seed)
+    words = [line.split("\t")[0] for file in files for line in read_list(file)]
+    random_words = [
+        word[: rng.randint(2, max(2, len(word)))] + rng.choice(SUFFIXES)
+        for word in rng.choices(words, k=size)
+    ]
+    mismatches = 0
+    for name, stream in (
+        ("regressions", suffix_regressions),
+        ("words", words),
+        ("random", random_words),
+    ):
+        start = time.perf_counter()
+        expected = list(map(MTransliteration().transliterate, stream))
+        old = time.perf_counter() - start
+        cache = SuffixCache(max_words=None)
+        start = time.perf_counter()
+        outputs = list(map(MTransliteration(cache=cache).transliterate, stream))
+        new = time.perf_counter() - start
+        failed = sum(a != b for a, b in zip(expected, outputs))
+        mismatches += failed
+        print(
+            f"{name:<12} {len(stream) / old:>8,.0f} -> {len(stream) / new:>8,.0f} "
+            f"words/s | {cache.stats()['composed']:>6} composed | {failed} mismatches"
+        )
+    return mismatches
+
+
+# Shared word cache
+_mt: MTransliteration | None = None
+
+
+def init_cache_worker(cache_name: str | None) -> None:
+    """Worker with a cache of its own, or attached to the shared cache."""
+    global _mt
+    cache = SuffixCache(suffixes=()) if cache_name is None else SharedCache(cache_name)
+    _mt = MTransliteration(cache=cache)
+
+
+def transliterate_chunk(words: List[str]) -> Tuple[List[str], int]:
+    """Outputs of a chunk and the number of words that ran the pipeline."""
+    _mt.cache.reset()
+    outputs = [_mt.transliterate(word) for word in words]
+    return outputs, _mt.cache.stats()["pipeline"]
+
+
+def bench_shared(
+    workers: List[int] = worker_counts,
+    size: int = 30000,
+    seed: int = 0,
+    chunk: int = 500,
+) -> int:
+    """Run a pool over a Zipf-distributed word stream, with a word cache per
+    worker and with one shared cache, and compare the outputs with a serial run.
+
+    Returns the number of mismatches.
+    """
+    rng = random.Random(seed)
+    words = [line.split("\t")[0] for line in read_list("data/transcribed.txt")]
+    rng.shuffle(words)
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    stream = rng.choices(words, weights=weights, k=size)
+    chunks = [stream[i : i + chunk] for i in range(0, len(stream), chunk)]
+    mt = MTransliteration(cache=SuffixCache(suffixes=()))
+    expected = [mt.transliterate(word) for word in stream]
+    print(f"{size} words, {len(set(stream))} unique, chunks of {chunk}")
+
+    mismatches = 0
+    for num_workers in workers:
+        for mode in ("local", "shared"):
+            cache = SharedCache.create(capacity=4 * size) if mode == "shared" else None
+            start = time.perf_counter()
+            with Pool(
+                num_workers,
+                initializer=init_cache_worker,
+                initargs=(cache.name if cache is not None else None,),
+            ) as pool:
+                results = pool.map(transliterate_chunk, chunks, chunksize=1)
+            elapsed = time.perf_counter() - start
+            outputs = [word_mm for chunk_mm, _ in results for word_mm in chunk_mm]
+            failed = sum(a != b for a, b in zip(expected, outputs))
+            mismatches += failed
+            print(
+                f"{num_workers:>2} workers {mode:<6} {elapsed:>7.2f} s | "
+                f"{size / elapsed:>8,.0f} words/s | "
+                f"{sum(runs for _, runs in results):>6} pipeline runs | "
+                f"{failed} mismatches"
+            )
+            if cache is not None:
+                cache.close()
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-component microbenchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Benchmark the current commit")
+    run_parser.add_argument(
+        "--repeat", type=int, default=20, help="Passes per component"
+    )
+    run_parser.add_argument("--size", type=int, default=500, help="Words per sample")
+    run_parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    run_parser.add_argument("--commit", help="Label to store results under")
+    compare_parser = subparsers.add_parser("compare", help="Compare two commits")
+    compare_parser.add_argument("old", help="Baseline commit")
+    compare_parser.add_argument("new", help="Commit to check for slowdowns")
+    compare_parser.add_argument("--alpha", type=float, default=0.01)
+    compare_parser.add_argument("--min-change", type=float, default=0.05)
+    import_parser = subparsers.add_parser(
+        "importtime", help="Check cold import time of the core modules"
+    )
+    import_parser.add_argument(
+        "--budget", type=float, default=100.0, help="Import time budget (ms)"
+    )
+    import_parser.add_argument("--repeat", type=int, default=5)
+    transducer_parser = subparsers.add_parser(
+        "transducer", help="Check the compiled baseline rules on word lists"
+    )
+    transducer_parser.add_argument("files", nargs="*", default=transducer_files)
+    syllabify_parser = subparsers.add_parser(
+        "syllabify", help="Check the batch syllabifier on word lists"
+    )
+    syllabify_parser.add_argument("files", nargs="*", default=syllabify_files)
+    normalize_parser = subparsers.add_parser(
+        "normalize", help="Check the bulk cleaner on word lists"
+    )
+    normalize_parser.add_argument("files", nargs="*", default=syllabify_files)
+    ssp_parser = subparsers.add_parser(
+        "ssp", help="Check the corpus SSP analytics on word lists"
+    )
+    ssp_parser.add_argument("files", nargs="*", default=syllabify_files)
+    suffix_parser = subparsers.add_parser(
+        "suffix", help="Check the suffix cache on word lists and random words"
+    )
+    suffix_parser.add_argument("files", nargs="*", default=syllabify_files)
+    suffix_parser.add_argument("--size", type=int, default=100000)
+    suffix_parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    shared_parser = subparsers.add_parser(
+        "shared", help="Per-worker vs shared word cache in a process pool"
+    )
+    shared_parser.add_argument("--workers", type=int, nargs="+", default=worker_counts)
+    shared_parser.add_argument("--size", type=int, default=30000, help="Stream size")
+    shared_parser.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--history", default=history_file, help="JSON history file")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        commit = args.commit or get_commit()
+        results = bench(repeat=args.repeat, size=args.size, seed=args.seed)
+        save_history(commit, results, args.history, size=args.size, seed=args.seed)
+        print(f"Saved results for {commit} to {Path(args.history).as_posix()}")
+    elif args.command == "importtime":
+        failures = check_import_time(budget=args.budget, repeat=args.repeat)
+        if failures:
+            print(f"Import time budget exceeded: {', '.join(failures)}")
+            raise SystemExit(1)
+    elif args.command == "transducer":
+        if check_transducers(args.files):
+            raise SystemExit(1)
+    elif args.command == "syllabify":
+        if check_batch_syllabification(args.files):
+            raise SystemExit(1)
+    elif args.command == "normalize":
+        if check_bulk_cleaner(args.files):
+            raise SystemExit(1)
+    elif args.command == "ssp":
+        if check_ssp(args.files):
+            raise SystemExit(1)
+    elif args.command == "suffix":
+        if check_suffix_cache(args.files, size=args.size, seed=args.seed):
+            raise SystemExit(1)
+    elif args.command == "shared":
+        if bench_shared(workers=args.workers, size=args.size, seed=args.seed):
+            raise SystemExit(1)
+    else:
+        slowdowns = compare(
+            args.old,
+            args.new,
+            args.history,
+            alpha=args.alpha,
+            min_change=args.min_change,
+        )
+        if slowdowns:
+            print(f"Significant slowdowns: {', '.join(sorted(slowdowns))}")
+            raise SystemExit(1)
@@ -1,7 +1,14 @@
 import argparse
+import io
+import re
+import sys
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from typing import Callable, Iterator, List, TextIO
 
-from gc_ import GlyphCorrection
-from mt_ import MTransliteration
+from src.gc_ import GlyphCorrection
+from src.mt_ import MTransliteration
 from run import run, run_mt, run_gc
 
 
@@ -10,32 +17,160 @@ def main() -> None:
     run_mt()
 
 
+# Streaming mode
+_convert_word: Callable[[str], str] | None = None
+
+
+def init_converter(gc: bool, mt: bool) -> None:
+    """Create the engines (once per process) and chain them: gc -> mt."""
+    global _convert_word
+    stages = []
+    if gc:
+        stages.append(GlyphCorrection().correct)
+    if mt:
+        stages.append(MTransliteration().transliterate)
+
+    def convert_word(word: str) -> str:
+        for stage in stages:
+            word = stage(word)
+        return word
+
+    _convert_word = convert_word
+
+
+def convert_text(text: str) -> str:
+    """Convert every word of free text, keeping the whitespace between them."""
+    return "".join(
+        token if not token or token.isspace() else _convert_word(token)
+        for token in re.split(r"(\s+)", text)
+    )
+
+
+def convert_lines(lines: List[str], column: int | None, append: bool) -> str:
+    """Convert a chunk of lines, either whole lines or one TSV column (0-based)."""
+    outputs = []
+    for line in lines:
+        if column is None:
+            outputs.append(convert_text(line))
+            continue
+        fields = line.split("\t")
+        if column < len(fields):
+            output = convert_text(fields[column])
+            if append:
+                fields.append(output)
+            else:
+                fields[column] = output
+        outputs.append("\t".join(fields))
+    return "".join(f"{output}\n" for output in outputs)
+
+
+def iter_line_chunks(files: List[str], size: int) -> Iterator[List[str]]:
+    """Lines (without newlines) of the files ("-" for stdin) in chunks."""
+    for file in files or ["-"]:
+        stream = (
+            io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+            if file == "-"
+            else open(file, encoding="utf-8")
+        )
+        with stream:
+            lines = (line.rstrip("\r\n") for line in stream)
+            while chunk := list(islice(lines, size)):
+                yield chunk
+
+
+def stream(
+    files: List[str],
+    output: TextIO,
+    gc: bool = False,
+    mt: bool = True,
+    column: int | None = None,
+    append: bool = False,
+    jobs: int = 1,
+    chunk_size: int = 1000,
+) -> None:
+    """Convert the input chunk by chunk and write every chunk as soon as it is done.
+
+    With `jobs` > 1 chunks are converted by a process pool. At most 2 * jobs
+    chunks are in flight, so memory use does not grow with the input size.
+    """
+    chunks = iter_line_chunks(files, chunk_size)
+    if jobs <= 1:
+        init_converter(gc, mt)
+        for chunk in chunks:
+            output.write(convert_lines(chunk, column, append))
+            output.flush()
+        return
+
+    with Pool(jobs, initializer=init_converter, initargs=(gc, mt)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(convert_lines, (chunk, column, append)))
+            if len(pending) >= 2 * jobs:
+                output.write(pending.popleft().get())
+                output.flush()
+        while pending:
+            output.write(pending.popleft().get())
+            output.flush()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run from main")
-    parser.add_argument("-m", action="store_true", help="Select module mt")
-    parser.add_argument("-g", action="store_true", help="Select module gc")
+    parser.add_argument("-m", "--mt", action="store_true", help="Select module mt")
+    parser.add_argument("-g", "--gc", action="store_true", help="Select module gc")
     parser.add_argument("-d", action="store_true", help="Enable detailed mode")
     parser.add_argument("-w", action="store_true", help="Enable wordmap mode")
     parser.add_argument("-e", action="store_true", help="Enable evaluation mode")
     parser.add_argument(
         "--root", help="Directory path which contains words.txt or targets.txt"
     )
+    parser.add_argument(
+        "-s",
+        "--stream",
+        action="store_true",
+        help="Stream files (or stdin) to stdout, --gc --mt chains both modules",
+    )
+    parser.add_argument(
+        "files", nargs="*", help="Input files for --stream (- for stdin)"
+    )
+    parser.add_argument(
+        "-c", "--column", type=int, help="Convert only this TSV column (1-based)"
+    )
+    parser.add_argument(
+        "-a",
+        "--append",
+        action="store_true",
+        help="Append the converted column instead of replacing it",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Lines per chunk")
 
     args = parser.parse_args()
 
-    if args.m:
-        mt = MTransliteration()
-        func = mt.transliterate_words
-    elif args.g:
-        gc = GlyphCorrection()
-        func = gc.correct_words
+    if args.stream:
+        stream(
+            files=args.files,
+            output=io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8"),
+            gc=args.gc,
+            mt=args.mt or not args.gc,
+            column=args.column - 1 if args.column else None,
+            append=args.append,
+            jobs=args.jobs,
+            chunk_size=args.chunk_size,
+        )
+    elif args.mt or args.gc:
+        if args.mt:
+            mt = MTransliteration()
+            func = mt.transliterate_words
+        else:
+            gc = GlyphCorrection()
+            func = gc.correct_words
+
+        mode = (
+            "detailed"
+            if args.d
+            else ("wordmap" if args.w else ("evaluation" if args.e else "simple"))
+        )
+        run(func=func, mode=mode, root_dir=args.root)
+        # Should contain targets.txt (evaluation) or words.txt (others) in args.root directory
     else:
         main()
-
-    mode = (
-        "detailed"
-        if args.d
-        else ("wordmap" if args.w else ("evaluation" if args.e else "simple"))
-    )
-    run(func=func, mode=mode, root_dir=args.root)
-    # Should contain targets.txt (evaluation) or words.txt (others) in args.root directory
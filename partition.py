@@ -0,0 +1,108 @@
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence
+
+from utils import LineWriter, iter_lines
+
+# A subset predicate gets the fields of a line
+Predicate = Callable[[List[str]], bool]
+
+
+def field_in(field: int, values: Iterable[str]) -> Predicate:
+    """Lines whose `field` is one of `values` (hashed once)."""
+    index = frozenset(values)
+    return lambda fields: fields[field] in index
+
+
+def field_in_file(
+    field: int,
+    file: str | Path,
+    column: int = 0,
+    delimiter: str = "\t",
+) -> Predicate:
+    """Lines whose `field` is listed in a membership file (`column` of its
+    non-empty lines)."""
+    return field_in(
+        field,
+        (
+            line.split(delimiter)[column].strip()
+            for line in iter_lines(file)
+            if line.strip()
+        ),
+    )
+
+
+def field_where(field: int, func: Callable[[str], bool]) -> Predicate:
+    """Lines whose `field` satisfies `func` (e.g. lambda x: int(x) == 1)."""
+    return lambda fields: func(fields[field])
+
+
+class Partitioner:
+    """
+    Assign every line of a delimited corpus to all matching subsets in a
+    single streaming pass.
+
+    Each subset is an output file with a predicate over the fields of a
+    line. A line may go to any number of subsets; the lines of a subset keep
+    the corpus order. Only `columns` are written (all fields by default).
+
+    Usage:
+        partitioner = Partitioner(
+            {
+                "indigenous/target.txt": field_where(2, lambda x: x == "1"),
+                "literature/target.txt": field_in_file(0, "words.txt"),
+            },
+            columns=(0, 1),
+            count_field=2,
+        )
+        partitioner.run("data/transcribed.txt")
+        partitioner.counts, partitioner.field_counts
+    """
+
+    def __init__(
+        self,
+        subsets: Dict[str | Path, Predicate],
+        columns: Sequence[int] | None = None,
+        delimiter: str = "\t",
+        count_field: int | None = None,
+    ) -> None:
+        self.subsets = {Path(file): predicate for file, predicate in subsets.items()}
+        self.columns = columns
+        self.delimiter = delimiter
+        self.count_field = count_field
+        self.num_lines = 0
+        self.counts: Dict[Path, int] = {}
+        # Distribution of the values of `count_field` over all lines
+        self.field_counts: Counter = Counter()
+
+    def run(self, source: str | Path) -> Dict[Path, int]:
+        """Partition `source` and return the number of lines per subset."""
+        delimiter, columns, count_field = self.delimiter, self.columns, self.count_field
+        writers = []
+        for file in self.subsets:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            writers.append(LineWriter(file))
+        subsets = list(zip(self.subsets.values(), writers))
+        num_lines = 0
+        self.field_counts.clear()
+        try:
+            for line in iter_lines(source):
+                if not line:
+                    continue
+                num_lines += 1
+                fields = line.split(delimiter)
+                if count_field is not None:
+                    self.field_counts[fields[count_field]] += 1
+                if columns is not None:
+                    line = delimiter.join(fields[idx] for idx in columns)
+                for predicate, writer in subsets:
+                    if predicate(fields):
+                        writer.write(line)
+        finally:
+            for writer in writers:
+                writer.close()
+        self.num_lines = num_lines
+        self.counts = {
+            file: writer.num_lines for file, writer in zip(self.subsets, writers)
+        }
+        return self.counts
@@ -1,14 +1,14 @@
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict
 
 import matplotlib.pyplot as plt
 import pandas as pd
-from tqdm import tqdm
 from src.mt_ import MTransliteration
 from src.mt_base_.b2m import Baseline, BaselineExtended
+from partition import Partitioner, field_in_file, field_where
 from run import run
-from utils import read_list, write_list
+from utils import read_list
 
 
 # Plot the result values
@@ -83,63 +83,36 @@ def evaluate(subdir: Dict[str, Path]):
 
 
 # Preparation
-def prepare_paper_mt(subdir: Dict[str, Path]):
+def prepare_paper_mt(subdir: Dict[int, Path]):
     """Prepare corpus transcription by splitting words into various categories."""
-    words_news = {
-        line.split("\t")[1].strip() for line in read_list("data/corrected.txt")
-    }
-    words_literature = read_list(subdir[3] / "words.txt")
-    transcribed = read_list("data/transcribed.txt")
-
-    count_ind, count_exo, count_ne, count_hy, count_rem = 0, 0, 0, 0, 0
-    words_ind, words_exo = set(), set()
-    # transcribed.txt --> code
-    for i, line in enumerate(tqdm(transcribed, desc="Extracting words"), start=1):
-        # print(f"{i=}. {line=}")
-        word_bn, _, dist_id = line.split("\t")
-        dist_id = int(dist_id)
-        if dist_id == 1:
-            words_ind.add(word_bn)
-            count_ind += 1
-        elif dist_id > 1:
-            words_exo.add(word_bn)
-            if dist_id == 2:
-                count_exo += 1
-            if dist_id == 3:
-                count_ne += 1
-            if dist_id == 4:
-                count_hy += 1
-        elif dist_id == 0:
-            count_rem += 1
-
-    words_dict: Dict[int, List[str]] = {
-        0: [],  # Indigenous words
-        1: [],  # Exotic words
-        2: [],  # News subset
-        3: [],  # Literature subset
-    }
-    # Start splitting
-    for line in tqdm(transcribed, desc="Preparing corpus"):
-        word_bn, word_mm, _ = line.split("\t")
-        new_line = f"{word_bn}\t{word_mm}"
-        if word_bn in words_ind:
-            words_dict[0].append(new_line)
-        if word_bn in words_exo:
-            words_dict[1].append(new_line)
-        if word_bn in words_news:
-            words_dict[2].append(new_line)
-        if word_bn in words_literature:
-            words_dict[3].append(new_line)
-
-    for i, corpus_dir in subdir.items():
-        corpus_dir.mkdir(exist_ok=True)
-        write_list(corpus_dir / "target.txt", words_dict[i])
+    # transcribed.txt: word_bn, word_mm, dist_id
+    # dist_id: 0 (remaining), 1 (indigenous), 2 (exotic), 3 (named entity), 4 (hybrid)
+    targets = {i: corpus_dir / "target.txt" for i, corpus_dir in subdir.items()}
+    partitioner = Partitioner(
+        {
+            # Indigenous words
+            targets[0]: field_where(2, lambda dist_id: int(dist_id) == 1),
+            # Exotic words
+            targets[1]: field_where(2, lambda dist_id: int(dist_id) > 1),
+            # News subset
+            targets[2]: field_in_file(0, "data/corrected.txt", column=1),
+            # Literature subset
+            targets[3]: field_in_file(0, subdir[3] / "words.txt"),
+        },
+        columns=(0, 1),
+        count_field=2,
+    )
+    counts = list(partitioner.run("data/transcribed.txt").values())
+    dist = partitioner.field_counts
+    count_ind, count_exo, count_ne, count_hy, count_rem = (
+        dist[str(dist_id)] for dist_id in (1, 2, 3, 4, 0)
+    )
 
     print(
         f"Information:\n"
-        f"{len(transcribed)=}\n"
-        f"{len(words_ind)=} | {len(words_exo)=}\n"
-        f"{len(words_news)=} | {len(words_literature)=}\n"
+        f"{partitioner.num_lines=}\n"
+        f"Indigenous={counts[0]} | Exotic={counts[1]}\n"
+        f"News={counts[2]} | Literature={counts[3]}\n"
     )
     print(
         f"Corpus Distribution\n"
@@ -1,14 +1,29 @@
+from collections import Counter, deque
+from contextlib import nullcontext
+from itertools import groupby
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
 
-from tqdm import tqdm
-import enchant
-
-from src.lon_.cleaner import Cleaner
+from src.lon_.bulk import BulkCleaner
 from src.gc_ import GlyphCorrection
 from src.mt_ import MTransliteration
 from src.mt_base_.b2m import Baseline, BaselineExtended
-from utils import read_dict, save_wordmap, write_dict, write_list
+from utils import (
+    ExternalSorter,
+    LineWriter,
+    get_compression,
+    is_sorted,
+    iter_chunks,
+    iter_dict,
+    read_dict,
+    read_list,
+    resolve_file,
+    save_sorted_wordmap,
+    save_wordmap,
+    write_dict,
+    write_list,
+    write_traces,
+)
 
 
 all_modes = [
@@ -24,6 +39,8 @@ def run(
     mode: str,
     model_name: str = "Proposed",
     root_dir: str | Path = "",
+    external_sort: bool = False,
+    with_counts: bool = False,
 ) -> None:
     """
     Runs the given function in the specified mode.
@@ -33,6 +50,8 @@ def run(
     mode (str): The mode in which to run the function. Options are "evaluate", "simple", "detailed", and "wordmap".
     model_name (str, optional): The name of the model. Defaults to "Proposed".
     root_dir (str | Path, optional): The root directory for input/output files. Defaults to an empty string.
+    external_sort (bool, optional): Wordmap mode with bounded memory (sorted runs spilled to disk). The wordmap is then sorted by word. Defaults to False.
+    with_counts (bool, optional): Also write unique_counts.txt (occurrences of every unique word) in wordmap mode. Defaults to False.
 
     Returns:
     None
@@ -56,32 +75,111 @@ def run(
         evaluate(func, root_dir, model_name)
         return
 
-    data_file = root_dir / "words.txt"
-    content = data_file.read_text(encoding="utf-8").strip()
-    output = func(content, show_steps=True) if mode == "detailed" else func(content)
+    # Input is processed in chunks of lines, so files larger than RAM can be used
+    data_file = resolve_file(root_dir / "words.txt")
+    chunks = ("\n".join(lines) for lines in iter_chunks(data_file))
+    # Outputs are compressed like the input (e.g. words.txt.gz -> output.txt.gz)
+    suffix = get_compression(data_file)
 
     # 2. Simple mode
     if mode == "simple":
-        output_file = root_dir / "output.txt"
-        output_file.write_text(output, encoding="utf-8")
+        convert_file(func, data_file, root_dir / f"output.txt{suffix}")
     # 3. Detailed mode
     elif mode == "detailed":
         # Step details
-        detailed_file = root_dir / "detailed.txt"
-        write_list(
-            detailed_file,
-            data=[f"{x}\t{y}" for x, y in zip(content.split("\n"), output.split("\n"))],
-        )
+        detailed_file = root_dir / f"detailed.txt{suffix}"
+        # Structured traces when the model provides them
+        trace_words = getattr(getattr(func, "__self__", None), "trace_words", None)
+        if trace_words is not None:
+            traces = (trace for chunk in chunks for trace in trace_words(chunk))
+            write_traces(detailed_file, traces)
+            return
+        with LineWriter(detailed_file) as writer:
+            for chunk in chunks:
+                output = func(chunk, show_steps=True)
+                writer.write_all(
+                    f"{x}\t{y}" for x, y in zip(chunk.split("\n"), output.split("\n"))
+                )
     # 4. Wordmap mode
     elif mode == "wordmap":
+        unique_file = root_dir / f"unique.txt{suffix}"
+        counts_file = root_dir / f"unique_counts.txt{suffix}" if with_counts else None
+        wordmap_file = root_dir / "wordmap.txt"
+        if external_sort:
+            wordmap_external(func, chunks, unique_file, wordmap_file, counts_file)
+            return
+        uniq_words, wordmap = Counter() if with_counts else set(), {}
+        for chunk in chunks:
+            output = func(chunk).split("\n")
+            uniq_words.update(output)
+            wordmap.update(zip(chunk.split("\n"), output))
         # Unique words
-        unique_file = root_dir / "unique.txt"
-        uniq_words = sorted(set(output.split("\n")))
-        write_list(unique_file, uniq_words)
+        write_list(unique_file, sorted(uniq_words))
+        if counts_file is not None:
+            write_list(
+                counts_file, [f"{word}\t{uniq_words[word]}" for word in sorted(uniq_words)]
+            )
         # Wordmap
-        wordmap_file = root_dir / "wordmap.txt"
-        wordmap = {x: y for x, y in zip(content.split("\n"), output.split("\n"))}
-        save_wordmap(wordmap=wordmap, wordmap_file=wordmap_file)
+        save_wordmap(wordmap=wordmap, wordmap_file=wordmap_file, binary=True)
+
+
+def wordmap_external(
+    func: Callable,
+    chunks: Iterable[str],
+    unique_file: Path,
+    wordmap_file: Path,
+    counts_file: Path | None = None,
+) -> None:
+    """Wordmap mode with bounded memory.
+
+    The outputs and the (word, output) pairs are sorted externally (runs are
+    spilled next to the wordmap) and merged, so unique.txt is the same as in
+    memory while the wordmap is sorted by word.
+    """
+    key = lambda line: line.split("\t", 1)[0]
+    tmp_dir = wordmap_file.parent
+    with ExternalSorter(tmp_dir=tmp_dir) as outputs, ExternalSorter(
+        key=key, tmp_dir=tmp_dir
+    ) as pairs:
+        for chunk in chunks:
+            output = func(chunk).split("\n")
+            outputs.extend(output)
+            pairs.extend(f"{x}\t{y}" for x, y in zip(chunk.split("\n"), output))
+        # Unique words (and their number of occurrences)
+        with LineWriter(unique_file) as uniq_words, (
+            LineWriter(counts_file) if counts_file is not None else nullcontext()
+        ) as counts:
+            for word, group in groupby(outputs):
+                uniq_words.write(word)
+                if counts is not None:
+                    counts.write(f"{word}\t{sum(1 for _ in group)}")
+        # Wordmap: the last output of a repeated word wins (as in a dict)
+        last_pairs = (
+            deque(group, maxlen=1)[0].split("\t", 1)
+            for _, group in groupby(pairs, key=key)
+        )
+        save_sorted_wordmap(last_pairs, wordmap_file, binary=True)
+
+
+def convert_file(
+    func: Callable,
+    input_file: str | Path,
+    output_file: str | Path,
+    atomic: bool = False,
+    encoding: str = "utf-8",
+) -> int:
+    """Convert a file chunk by chunk (simple mode) and return the number of
+    input lines. With `atomic`, the output file only appears once complete.
+    The input is read with `encoding` (e.g. latin-1 for cmudict-0.7b), the
+    output is always UTF-8."""
+    num_lines = 0
+    with LineWriter(output_file, atomic=atomic) as writer:
+        for lines in iter_chunks(input_file, encoding=encoding):
+            chunk = "\n".join(lines)
+            if chunk.strip():
+                writer.write(func(chunk))
+            num_lines += len(lines)
+    return num_lines
 
 
 def evaluate(
@@ -89,53 +187,85 @@ def evaluate(
     root_dir: str | Path,
     model_name: str,
 ):
+    # Imported here so that importing run.py (and the package) stays cheap.
+    from tqdm import tqdm
+    import enchant
+
     output_dir = Path(root_dir) / model_name
     output_dir.mkdir(exist_ok=True)
     print(f"Output directory for evaluation: {output_dir.as_posix()}")
-    target_file, result_file, output_file, comparison_file = (
-        root_dir / "target.txt",
+    target_file = resolve_file(root_dir / "target.txt")
+    suffix = get_compression(target_file)
+    result_file, output_file, comparison_file = (
         output_dir / "result.txt",
-        output_dir / "output.txt",
-        output_dir / "comparison.txt",
+        output_dir / f"output.txt{suffix}",
+        output_dir / f"comparison.txt{suffix}",
+    )
+    # Inputs are evaluated in sorted order: stream the target file when it is
+    # already sorted with unique inputs, otherwise sort it in memory.
+    pairs = (
+        iter_dict(target_file)
+        if is_sorted(target_file)
+        else sorted(read_dict(target_file).items())
     )
-    target_dict = read_dict(target_file)
-    inputs = sorted(target_dict.keys())
-    output_dict = {x: func(x) for x in tqdm(inputs, desc=f"Executing {model_name}")}
     num_mismatch = 0  # Number of words with error
-    comparison = []
     err = 0  # Total edit distance
-    M, N = len(inputs), 0
-    for x in tqdm(inputs, desc=f"Evaluating {model_name}"):
-        target = target_dict[x]
-        output = output_dict[x]
-        if target != output:
-            num_mismatch += 1
-        edit_distance = enchant.utils.levenshtein(target, output)
-        err += edit_distance
-        comparison.append(f"{x}\t{target}\t{output}\t{edit_distance}")
-        N += max(len(target), len(output))
-
-    evaluation = (
+    M, N = 0, 0
+    with LineWriter(output_file) as outputs, LineWriter(comparison_file) as comparison:
+        for x, target in tqdm(pairs, desc=f"Evaluating {model_name}"):
+            output = func(x)
+            if target != output:
+                num_mismatch += 1
+            edit_distance = enchant.utils.levenshtein(target, output)
+            err += edit_distance
+            outputs.write(f"{x}\t{output}")
+            comparison.write(f"{x}\t{target}\t{output}\t{edit_distance}")
+            M += 1
+            N += max(len(target), len(output))
+
+    evaluation = format_evaluation(num_mismatch, err, M, N)
+    print(evaluation)
+    result_file.write_text(evaluation)
+
+
+def format_evaluation(num_mismatch: int, err: int, M: int, N: int) -> str:
+    """Content of result.txt from the evaluation counts."""
+    return (
         f"{(num_mismatch/M)*100:.02f}\n{(err/N)*100:.02f}\n"
         f"Word Level Accuracy={(1-num_mismatch/M)*100=:.02f}% | {num_mismatch=} | {M=}\n"
         f"Character Level Accuracy={(1-err/N)*100=:.02f}% | {err=} | {N=}"
     )
-    print(evaluation)
-    result_file.write_text(evaluation)
-    write_list(output_file, [f"{x}\t{y}" for x, y in output_dict.items()])
-    write_list(comparison_file, comparison)
 
 
 # Preparation
 def prepare_files(
     src_file: str | Path,
     target_dir: str | Path,
+    compression: str | None = None,
 ) -> None:
     print(f"Preparing files:\n{src_file} --> --> --> {target_dir}\n")
-    target_dict = read_dict(src_file)
-    write_dict(Path(target_dir) / "target.txt", target_dict)
-    write_list(Path(target_dir) / "words.txt", target_dict.keys(), True)
-    print(f"No of words: {len(target_dict)}")
+    # Compressed like the source file unless given (e.g. ".gz")
+    suffix = get_compression(src_file) if compression is None else compression
+    target_file = Path(target_dir) / f"target.txt{suffix}"
+    words_file = Path(target_dir) / f"words.txt{suffix}"
+    if not is_sorted(src_file, strict=False):
+        target_dict = read_dict(src_file)
+        write_dict(target_file, target_dict)
+        write_list(words_file, target_dict.keys(), True)
+        print(f"No of words: {len(target_dict)}")
+        return
+    # Sorted source: stream it, keeping the last value of repeated keys (as a dict)
+    with LineWriter(target_file) as targets, LineWriter(words_file) as words:
+        last_key, last_value = None, None
+        for key, value in iter_dict(src_file):
+            if last_key is not None and key != last_key:
+                targets.write(f"{last_key}\t{last_value}")
+                words.write(last_key)
+            last_key, last_value = key, value
+        if last_key is not None:
+            targets.write(f"{last_key}\t{last_value}")
+            words.write(last_key)
+    print(f"No of words: {words.num_lines}")
 
 
 # Runner functions
@@ -165,16 +295,17 @@ if __name__ == "__main__":
 # Clean
 def clean_target(file: str | Path) -> None:
     """Clean the target file."""
-    c = Cleaner()
     target_file: Path = Path(file)
-    new_lines = set()
-    lines = target_file.read_text(encoding="utf-8").strip().split("\n")
-    for line in tqdm(lines, desc="Cleaning..."):
-        word_bn, word_mm = line.split("\t")
-        cleaned_word_bn = word_bn
-        cleaned_word_mm = c.clean_mm_utf(word_mm)
-        new_lines.add(f"{cleaned_word_bn}\t{cleaned_word_mm}")
-    target_file.write_text("\n".join(sorted(new_lines)), encoding="utf-8")
+    pairs = [line.split("\t") for line in read_list(target_file)]
+    # All Meetei Mayek words in one pass (same output as Cleaner.clean_mm_utf)
+    cleaned = BulkCleaner.clean_words(
+        BulkCleaner.clean_mm_utf, [word_mm for _, word_mm in pairs]
+    )
+    new_lines = {
+        f"{word_bn}\t{cleaned_word_mm}"
+        for (word_bn, _), cleaned_word_mm in zip(pairs, cleaned)
+    }
+    write_list(target_file, new_lines, sort=True)
 
 
 # clean_target("data/mt_/target.txt")
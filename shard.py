@@ -0,0 +1,336 @@
+import argparse
+import heapq
+import json
+import zlib
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from run import all_modes, format_evaluation, run
+from utils import LineWriter, get_compression, iter_lines, resolve_file, save_wordmap
+
+VERSION = 1
+input_files = ["words.txt", "target.txt"]
+manifest_name = "manifest.json"
+# Shard of every line of words.txt (hash sharding), to restore the input order
+order_name = "words.order"
+# Engines that transliterate whole texts (not word by word) are only
+# evaluated, as in run_mt()
+evaluate_only_engines = {"baseline", "baseline_extended"}
+
+
+def get_engine(engine: str) -> Tuple[Callable, str]:
+    """Function and model name of an engine, as used by run_mt() and run_gc()."""
+    if engine == "mt":
+        from src.mt_ import MTransliteration
+
+        return MTransliteration().transliterate_words, "Proposed"
+    if engine == "gc":
+        from src.gc_ import GlyphCorrection
+
+        return GlyphCorrection().correct_words, "Proposed"
+    if engine == "baseline":
+        from src.mt_base_ import Baseline
+
+        return Baseline().transliterate, "Baseline"
+    if engine == "baseline_extended":
+        from src.mt_base_ import BaselineExtended
+
+        return BaselineExtended().transliterate, "Baseline 2"
+    raise ValueError(f"Unknown engine: {engine}")
+
+
+def shard_of(line: str, num_shards: int) -> int:
+    """Stable shard of a line by the hash of its key (first tab separated field)."""
+    return zlib.crc32(line.split("\t", 1)[0].encode("utf-8")) % num_shards
+
+
+def shard_dir(root: Path, idx: int) -> Path:
+    return root / f"shard_{idx:05d}"
+
+
+# 1. Split
+def split(
+    root_dir: str | Path,
+    shards_dir: str | Path,
+    num_shards: int,
+    by: str = "hash",
+) -> Dict:
+    """Split words.txt and target.txt of `root_dir` into `num_shards` shard
+    directories and write the manifest.
+
+    - hash: lines go to the shard of their key, so a key (with all its
+      repetitions) always lands in the same shard, in words.txt and target.txt.
+    - range: consecutive runs of lines of (almost) equal size.
+
+    Empty lines are dropped, as `run()` skips them. Compressed inputs
+    (e.g. words.txt.gz) are split into shards compressed the same way.
+    """
+    root_dir, shards_dir = Path(root_dir), Path(shards_dir)
+    files = {name: resolve_file(root_dir / name) for name in input_files}
+    files = {name: file for name, file in files.items() if file.exists()}
+    if not files:
+        raise FileNotFoundError(
+            f"{root_dir} has no {' or '.join(input_files)} (plain or compressed)."
+        )
+    for idx in range(num_shards):
+        shard_dir(shards_dir, idx).mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "version": VERSION,
+        "root_dir": root_dir.as_posix(),
+        "num_shards": num_shards,
+        "by": by,
+        "files": {},
+    }
+    for name, file in files.items():
+        # Shard files keep the compression of their input (e.g. words.txt.gz)
+        shard_name = name + get_compression(file)
+        writers = [
+            LineWriter(shard_dir(shards_dir, idx) / shard_name)
+            for idx in range(num_shards)
+        ]
+        order = array("H") if by == "hash" and name == "words.txt" else None
+        if by == "hash":
+            for line in iter_lines(file):
+                if line:
+                    idx = shard_of(line, num_shards)
+                    writers[idx].write(line)
+                    if order is not None:
+                        order.append(idx)
+        else:
+            num_lines = sum(1 for line in iter_lines(file) if line)
+            size, extra = divmod(num_lines, num_shards)
+            bounds = [
+                (idx + 1) * size + min(idx + 1, extra) for idx in range(num_shards)
+            ]
+            idx, count = 0, 0
+            for line in iter_lines(file):
+                if line:
+                    while count == bounds[idx]:
+                        idx += 1
+                    writers[idx].write(line)
+                    count += 1
+        for writer in writers:
+            writer.close()
+        if order is not None:
+            (shards_dir / order_name).write_bytes(order.tobytes())
+        manifest["files"][name] = [writer.num_lines for writer in writers]
+    (shards_dir / manifest_name).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def load_manifest(shards_dir: str | Path) -> Dict:
+    manifest = json.loads((Path(shards_dir) / manifest_name).read_text())
+    if manifest.get("version") != VERSION:
+        raise ValueError(f"{shards_dir} is not a version {VERSION} shard directory.")
+    return manifest
+
+
+# 2. Run
+def run_shard(
+    shards_dir: str | Path,
+    idx: int,
+    engine: str = "mt",
+    modes: List[str] | None = None,
+) -> None:
+    """Run an engine on one shard, like a single-node `run()` on its root.
+
+    Empty shards are skipped (and left out when merging). The baseline
+    engines only support the evaluate mode (their default).
+    """
+    if engine in evaluate_only_engines:
+        modes = modes or ["evaluate"]
+        if any(mode != "evaluate" for mode in modes):
+            raise ValueError(f"The {engine} engine only supports the evaluate mode.")
+    manifest = load_manifest(shards_dir)
+    root = shard_dir(Path(shards_dir), idx)
+    func, model_name = get_engine(engine)
+    for mode in modes or all_modes:
+        # run() reads target.txt in evaluate mode and words.txt otherwise
+        name = "target.txt" if mode == "evaluate" else "words.txt"
+        counts = manifest["files"].get(name)
+        if counts and counts[idx]:
+            run(func, mode, model_name=model_name, root_dir=root)
+
+
+# 3. Merge
+def iter_input_lines(shards_dir: Path, manifest: Dict) -> Iterator[Tuple[int, str]]:
+    """(shard, line) of every line of words.txt in the original order."""
+    counts = manifest["files"]["words.txt"]
+    if manifest["by"] == "hash":
+        order = array("H")
+        order.frombytes((shards_dir / order_name).read_bytes())
+    else:
+        order = (idx for idx, count in enumerate(counts) for _ in range(count))
+    shard_lines = [
+        iter_lines(resolve_file(shard_dir(shards_dir, idx) / "words.txt"))
+        for idx in range(len(counts))
+    ]
+    for idx in order:
+        yield idx, next(shard_lines[idx])
+
+
+def merge_ordered(shards_dir: Path, manifest: Dict, name: str, output_dir: Path):
+    """Merge per-word outputs (output.txt, detailed.txt) in the input order.
+
+    The engines write one line per word of every input line. `name` may be
+    compressed (e.g. output.txt.gz), like the outputs of `run()`.
+    """
+    outputs = [
+        iter_lines(resolve_file(shard_dir(shards_dir, idx) / name))
+        for idx in range(manifest["num_shards"])
+    ]
+    with LineWriter(output_dir / name) as writer:
+        for idx, line in iter_input_lines(shards_dir, manifest):
+            for _ in line.split():
+                # A trailing empty line is not read back by iter_lines
+                writer.write(next(outputs[idx], ""))
+
+
+def merge_wordmap(shards_dir: Path, manifest: Dict, output_dir: Path) -> None:
+    """Merge unique.txt and the wordmaps (keys in order of first occurrence)."""
+    unique_files = [
+        resolve_file(shard_dir(shards_dir, idx) / "unique.txt")
+        for idx, count in enumerate(manifest["files"]["words.txt"])
+        if count
+    ]
+    uniq_words = heapq.merge(*map(iter_lines, unique_files))
+    with LineWriter(output_dir / unique_files[0].name) as writer:
+        last = None
+        for word in uniq_words:
+            if word != last:
+                writer.write(word)
+            last = word
+
+    wordmap = dict.fromkeys(line for _, line in iter_input_lines(shards_dir, manifest))
+    # Later shards hold later occurrences (the last value wins, as in a dict)
+    for idx, count in enumerate(manifest["files"]["words.txt"]):
+        if count:
+            wordmap_file = shard_dir(shards_dir, idx) / "wordmap.json"
+            wordmap.update(json.loads(wordmap_file.read_text(encoding="utf-8")))
+    save_wordmap(wordmap=wordmap, wordmap_file=output_dir / "wordmap.txt", binary=True)
+
+
+def merge_evaluation(
+    shards_dir: Path, manifest: Dict, model_name: str, output_dir: Path
+) -> None:
+    """Merge the sorted outputs of a model and recompute the evaluation counts.
+
+    The comparison files may be compressed (e.g. comparison.txt.gz), like the
+    outputs of `run()`, and the merged files keep their compression.
+    """
+    comparison_files = [
+        resolve_file(shard_dir(shards_dir, idx) / model_name / "comparison.txt")
+        for idx, count in enumerate(manifest["files"]["target.txt"])
+        if count
+    ]
+    comparisons = heapq.merge(
+        *map(iter_lines, comparison_files),
+        key=lambda line: line.split("\t", 1)[0],
+    )
+    suffix = get_compression(comparison_files[0])
+    num_mismatch, err, M, N = 0, 0, 0, 0
+    model_dir = output_dir / model_name
+    model_dir.mkdir(exist_ok=True)
+    with LineWriter(model_dir / f"output.txt{suffix}") as outputs, LineWriter(
+        model_dir / f"comparison.txt{suffix}"
+    ) as comparison:
+        last = None
+        for line in comparisons:
+            # Equal keys in several (range) shards: keep the last one
+            x, target, output, edit_distance = line.split("\t")
+            if last is not None and last[0] != x:
+                num_mismatch, err, M, N = count_evaluation(
+                    last, outputs, comparison, num_mismatch, err, M, N
+                )
+            last = (x, target, output, edit_distance)
+        if last is not None:
+            num_mismatch, err, M, N = count_evaluation(
+                last, outputs, comparison, num_mismatch, err, M, N
+            )
+    (model_dir / "result.txt").write_text(format_evaluation(num_mismatch, err, M, N))
+
+
+def count_evaluation(
+    row: Tuple[str, str, str, str],
+    outputs: LineWriter,
+    comparison: LineWriter,
+    num_mismatch: int,
+    err: int,
+    M: int,
+    N: int,
+) -> Tuple[int, int, int, int]:
+    x, target, output, edit_distance = row
+    outputs.write(f"{x}\t{output}")
+    comparison.write("\t".join(row))
+    return (
+        num_mismatch + (target != output),
+        err + int(edit_distance),
+        M + 1,
+        N + max(len(target), len(output)),
+    )
+
+
+def merge(shards_dir: str | Path, output_dir: str | Path) -> None:
+    """Combine the outputs of all shards into `output_dir`, identical to a
+    single-node `run()` on the original root directory."""
+    shards_dir, output_dir = Path(shards_dir), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(shards_dir)
+    counts = manifest["files"].get("words.txt", [])
+    if any(counts):
+        first = shard_dir(shards_dir, next(idx for idx, n in enumerate(counts) if n))
+        for name in ("output.txt", "detailed.txt"):
+            file = resolve_file(first / name)
+            if file.exists():
+                merge_ordered(shards_dir, manifest, file.name, output_dir)
+        if (first / "wordmap.json").exists():
+            merge_wordmap(shards_dir, manifest, output_dir)
+    counts = manifest["files"].get("target.txt", [])
+    if any(counts):
+        first = shard_dir(shards_dir, next(idx for idx, n in enumerate(counts) if n))
+        for model_dir in sorted(first.iterdir()):
+            if resolve_file(model_dir / "comparison.txt").exists():
+                merge_evaluation(shards_dir, manifest, model_dir.name, output_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shard, run and merge a corpus")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    split_parser = subparsers.add_parser("split", help="Split a root directory")
+    split_parser.add_argument("root_dir", help="Contains words.txt and/or target.txt")
+    split_parser.add_argument("shards_dir")
+    split_parser.add_argument("-n", "--num-shards", type=int, required=True)
+    split_parser.add_argument("--by", choices=["hash", "range"], default="hash")
+    run_parser = subparsers.add_parser("run", help="Run an engine on one shard")
+    run_parser.add_argument("shards_dir")
+    run_parser.add_argument("idx", type=int, help="Shard index")
+    run_parser.add_argument(
+        "--engine",
+        choices=["mt", "gc", "baseline", "baseline_extended"],
+        default="mt",
+    )
+    run_parser.add_argument("--modes", nargs="+", choices=all_modes)
+    merge_parser = subparsers.add_parser("merge", help="Merge the shard outputs")
+    merge_parser.add_argument("shards_dir")
+    merge_parser.add_argument("output_dir")
+
+    args = parser.parse_args()
+
+    if args.command == "split":
+        try:
+            manifest = split(
+                args.root_dir, args.shards_dir, args.num_shards, by=args.by
+            )
+        except FileNotFoundError as e:
+            parser.error(str(e))
+        for name, counts in manifest["files"].items():
+            print(f"{name}: {counts}")
+    elif args.command == "run":
+        if args.engine in evaluate_only_engines and any(
+            mode != "evaluate" for mode in args.modes or []
+        ):
+            parser.error(f"--engine {args.engine} only supports --modes evaluate")
+        run_shard(args.shards_dir, args.idx, engine=args.engine, modes=args.modes)
+    else:
+        merge(args.shards_dir, args.output_dir)
@@ -1,9 +1,25 @@
-from typing import Dict, List
-from ..lon_ import Phoneme, ARPABETPhoneme, PhonemeInventory, BN, MM
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..lon_ import Phoneme, ARPABETPhoneme, PhonemeInventory, BN
+from ..mt_ import Spelling
+from .lexicon import iter_lexicon, parse_entry
+
+__all__ = ["ARPA2MM", "ARPATransliteration", "iter_lexicon", "parse_entry"]
 
 
 class ARPA2MM:
-    def get_map():
+    _map: Dict[str, str] | None = None
+
+    @classmethod
+    def get_map(cls) -> Dict[str, str]:
+        """ARPAbet (2 letters) -> phoneme(s), built once per process."""
+        if cls._map is None:
+            cls._map = cls.build_map()
+        return cls._map
+
+    @staticmethod
+    def build_map() -> Dict[str, str]:
         arpa = ARPABETPhoneme(num_letters=2)
         mm_to_arpabet: Dict[str | List[str]] = {
             Phoneme.k.value: [arpa.phoneme_K],
@@ -52,3 +68,124 @@ class ARPA2MM:
             for ipa in ipa_list
             if ipa_list
         }
+
+
+class ARPATransliteration:
+    """
+    ARPAbet pronunciations (e.g. CMUdict) to Meetei Mayek.
+
+    Phonemes are mapped with ARPA2MM (stress digits dropped), split into
+    syllables around their vowels and spelt by the Spelling stage of the
+    Bengali pipeline. Spelt syllables are cached, as lexicons repeat them a lot.
+
+    Usage:
+        arpa = ARPATransliteration()
+        arpa.transliterate("K AA1 M P Y UW0 T ER0")
+        arpa.transliterate_file("cmudict.dict", "cmudict.mm.tsv")
+    """
+
+    def __init__(self, pi: PhonemeInventory | None = None) -> None:
+        pi = pi if pi is not None else PhonemeInventory.shared()
+        self.spelling = Spelling(pi=pi)
+        self.phoneme_set_C = pi.phoneme_set_C
+        self.phoneme_set_V = pi.phoneme_set_V
+        # Combined values (/XR/, /XL/, ...) are split into single phonemes
+        values = {phoneme.value for phoneme in Phoneme}
+        self.phonemes: Dict[str, Tuple[str, ...]] = {
+            arpa: (value,) if value in values else tuple(value)
+            for arpa, value in ARPA2MM.get_map().items()
+        }
+        self.cache: Dict[Tuple[str, ...], str] = {}
+
+    def to_phonemes(self, arpabet: List[str]) -> List[str]:
+        phonemes = []
+        for arpa in arpabet:
+            try:
+                phonemes.extend(self.phonemes[arpa.rstrip("012").upper()])
+            except KeyError:
+                raise ValueError(f"Unknown ARPAbet phoneme: {arpa}") from None
+        return phonemes
+
+    def onset_start(self, phonemes: List[str], start: int, end: int) -> int:
+        """Start of the onset of the vowel at `end`, given the consonants
+        `phonemes[start:end]` (same onset clusters as Syllabification)."""
+        onset = end - 1
+        if onset > start and phonemes[end - 1] in {
+            Phoneme.r.value,
+            Phoneme.j.value,
+            Phoneme.w.value,
+        }:
+            onset -= 1
+            if onset > start and phonemes[onset - 1] == Phoneme.s.value:
+                onset -= 1
+        return max(onset, start)
+
+    def syllabify(self, phonemes: List[str]) -> List[List[str]]:
+        """Split phonemes into syllables for Spelling, one vowel each (virama
+        between the consonants of an onset cluster)."""
+        nuclei = [
+            i for i, phoneme in enumerate(phonemes) if phoneme in self.phoneme_set_V
+        ]
+        bounds = [0]
+        if nuclei:
+            # Extra word initial consonants (before the onset) stand alone
+            bounds.append(self.onset_start(phonemes, 0, nuclei[0]))
+            bounds.extend(
+                self.onset_start(phonemes, prev + 1, nucleus)
+                for prev, nucleus in zip(nuclei, nuclei[1:])
+            )
+        bounds.append(len(phonemes))
+        syllables = []
+        for start, end in zip(bounds, bounds[1:]):
+            if start == end:
+                continue
+            syllable = [phonemes[start]]
+            is_onset = phonemes[start] in self.phoneme_set_C
+            for phoneme in phonemes[start + 1 : end]:
+                if phoneme in self.phoneme_set_C:
+                    if is_onset:
+                        syllable.append(BN.virama)
+                else:
+                    is_onset = False
+                syllable.append(phoneme)
+            syllables.append(syllable)
+        return syllables
+
+    def spell_syllable(self, syllable: List[str]) -> str:
+        key = tuple(syllable)
+        chars_mm = self.cache.get(key)
+        if chars_mm is None:
+            chars_mm = self.cache[key] = self.spelling.spell([syllable])[0]
+        return chars_mm
+
+    def transliterate(self, pronunciation: str | List[str]) -> str:
+        """Meetei Mayek spelling of an ARPAbet pronunciation ("K AE1 T")."""
+        if isinstance(pronunciation, str):
+            pronunciation = pronunciation.split()
+        return "".join(
+            self.spell_syllable(syllable)
+            for syllable in self.syllabify(self.to_phonemes(pronunciation))
+        )
+
+    def transliterate_lexicon(self, text: str) -> str:
+        """Convert CMUdict-format lines to `word<TAB>word_mm` lines (simple
+        mode function, as used by run.convert_file and batch.py)."""
+        entries = filter(None, map(parse_entry, text.split("\n")))
+        return "\n".join(
+            f"{word}\t{self.transliterate(arpabet)}" for word, arpabet in entries
+        )
+
+    def transliterate_file(
+        self,
+        input_file: str | Path,
+        output_file: str | Path,
+        encoding: str = "utf-8",
+    ) -> int:
+        """Stream a lexicon to a `word<TAB>word_mm` file and return the number
+        of entries."""
+        num_entries = 0
+        with Path(output_file).open("w", encoding="utf-8") as f:
+            for word, arpabet in iter_lexicon(input_file, encoding=encoding):
+                f.write(f"{word}\t{self.transliterate(arpabet)}\n")
+                num_entries += 1
+        return num_entries
@@ -0,0 +1,31 @@
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+
+def parse_entry(line: str) -> Tuple[str, List[str]] | None:
+    """Word and ARPAbet phonemes of a CMUdict line (None for comments and
+    empty lines).
+
+    Handles both formats: `WORD  W ER1 D` (cmudict-0.7b, `;;;` comments) and
+    `word(2) w er1 d # comment` (cmudict.dict). Alternative pronunciations keep
+    their `(n)` marker, so every entry gets its own output line.
+    """
+    line = line.split(" #", 1)[0].strip()
+    if not line or line.startswith(";;;"):
+        return None
+    word, *phonemes = line.split()
+    return word, phonemes
+
+
+def iter_lexicon(
+    file: str | Path, encoding: str = "utf-8"
+) -> Iterator[Tuple[str, List[str]]]:
+    """Stream the entries of a CMUdict-format lexicon.
+
+    cmudict-0.7b is Latin-1 encoded (pass `encoding="latin-1"`).
+    """
+    with Path(file).open(encoding=encoding) as f:
+        for line in f:
+            entry = parse_entry(line)
+            if entry is not None:
+                yield entry
@@ -1,12 +1,20 @@
+from typing import Iterator
+
 from .correction import Correction
+from .trace import CorrectionTrace
+from ..perf_ import StageMetrics, TailSampler
 
-__all__ = ["GlyphCorrection", "evaluate_gc"]
+__all__ = ["GlyphCorrection", "CorrectionTrace", "evaluate_gc"]
 
 
 class GlyphCorrection:
 
-    def __init__(self) -> None:
-        self.correction = Correction()
+    def __init__(
+        self,
+        metrics: StageMetrics | None = None,
+        tail: TailSampler | None = None,
+    ) -> None:
+        self.correction = Correction(metrics=metrics, tail=tail)
 
     def correct_words(
         self,
@@ -24,3 +32,10 @@ class GlyphCorrection:
         include_steps: bool = False,
     ) -> str:
         return self.correction.correct(text=text, include_steps=include_steps)
+
+    def trace_words(self, text: str) -> Iterator[CorrectionTrace]:
+        """Lazily trace every word of the text."""
+        return (self.correction.trace(word) for word in text.split())
+
+    def trace(self, text: str) -> CorrectionTrace:
+        return self.correction.trace(text)
@@ -1,42 +1,71 @@
 from typing import Dict, List, Set, Tuple
 
+from .trace import CorrectionTrace
 from .u2b import U2B
 from ..lon_ import BN, Cleaner
+from ..perf_ import StageMetrics, StageTimer, TailSampler
 
 
 class Correction:
 
+    def __init__(
+        self,
+        metrics: StageMetrics | None = None,
+        tail: TailSampler | None = None,
+    ) -> None:
+        # Optional per-stage instrumentation and slow word capture
+        self.metrics = metrics
+        self.tail = tail
+
     def correct(
         self,
         text: str,
         include_steps: bool = False,
     ) -> str:
-        steps = []
+        trace = self.trace(text)
+        # Returns final content
+        return trace.output if not include_steps else trace.to_tsv()
+
+    def trace(self, text: str) -> CorrectionTrace:
+        timer = (
+            StageTimer(self.metrics, len(text))
+            if self.metrics is not None or self.tail is not None
+            else None
+        )
         # Step 0: Adjusting s550 characters
-        text = self.__adjust_glyph(text, charmap=U2B.premap)
-        steps.append(text)
+        adjusted = self.__adjust_glyph(text, charmap=U2B.premap)
+        if timer:
+            timer.lap("adjust_glyph")
 
         # Step 1: Mapping Bengali Alphabet
-        text = self.__map_unicode(text, charmap=U2B.charmap)
-        steps.append(text)
+        mapped = self.__map_unicode(
+            adjusted, charmap=U2B.charmap, sorted_keys=U2B.sorted_keys
+        )
+        if timer:
+            timer.lap("map_unicode")
 
         # Step 2: Fix suffix position of r and then mapping
-        text = self.__fix_r_glyph(
-            text, chars=U2B.s550_extra_chars, charmap=U2B.R_char_r
+        fixed_r = self.__fix_r_glyph(
+            mapped, chars=U2B.s550_extra_chars, charmap=U2B.R_char_r
         )
-        steps.append(text)
+        if timer:
+            timer.lap("fix_r_glyph")
 
         # Step 3: Fix prefix position of vowels and fix vowels
-        text = self.__fix_vowels(
-            text,
+        output = self.__fix_vowels(
+            fixed_r,
             chars=BN.L_vowels,
         )
-        text = Cleaner.clean_bn_utf(text)
+        output = Cleaner.clean_bn_utf(output)
 
-        steps.append(text)
+        trace = CorrectionTrace(text, adjusted, mapped, fixed_r, output)
+        if timer:
+            timer.lap("fix_vowels")
+            seconds = timer.stop()
+            if self.tail is not None and self.tail.is_slow(seconds):
+                self.tail.record(text, seconds, timer.laps, trace.to_dict())
 
-        # Returns final content
-        return text if not include_steps else "\t".join(steps)
+        return trace
 
     # Private methods
     def __adjust_glyph(self, text: str, charmap: Dict[str, str]) -> str:
@@ -44,9 +73,15 @@ class Correction:
             text = text.replace(key, value)
         return text
 
-    def __map_unicode(self, text: str, charmap: Dict[str, str]) -> str:
+    def __map_unicode(
+        self,
+        text: str,
+        charmap: Dict[str, str],
+        sorted_keys: List[str] | None = None,
+    ) -> str:
         # 1. Mapping to correct unicode values (in order of decreasing size of key length)
-        sorted_keys = sorted(charmap.keys(), key=len, reverse=True)
+        if sorted_keys is None:
+            sorted_keys = sorted(charmap.keys(), key=len, reverse=True)
         for key in sorted_keys:
             text = text.replace(key, charmap[key])
         # 2. Fix redundant virama
@@ -0,0 +1,48 @@
+from typing import Dict
+
+
+class CorrectionTrace:
+    """
+    Intermediate steps of correcting a single word.
+
+    Attributes:
+        text (str): input s550 text
+        adjusted (str): after adjusting s550 glyphs
+        mapped (str): after mapping to Bengali unicode
+        fixed_r (str): after fixing the position of r glyph
+        output (str): after fixing the position of vowels
+    """
+
+    __slots__ = ("text", "adjusted", "mapped", "fixed_r", "output")
+
+    def __init__(
+        self,
+        text: str,
+        adjusted: str,
+        mapped: str,
+        fixed_r: str,
+        output: str,
+    ) -> None:
+        self.text = text
+        self.adjusted = adjusted
+        self.mapped = mapped
+        self.fixed_r = fixed_r
+        self.output = output
+
+    @property
+    def word(self) -> str:
+        return self.text
+
+    def to_tsv(self, include_word: bool = False) -> str:
+        """Tab separated steps, same as `correct(text, include_steps=True)`."""
+        steps = f"{self.adjusted}\t{self.mapped}\t{self.fixed_r}\t{self.output}"
+        return f"{self.text}\t{steps}" if include_word else steps
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "word": self.text,
+            "adjust_glyph": self.adjusted,
+            "map_unicode": self.mapped,
+            "fix_r_glyph": self.fixed_r,
+            "fix_vowels": self.output,
+        }
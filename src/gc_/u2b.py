@@ -1,4 +1,4 @@
-from typing import Dict, Set
+from typing import Dict, List, Set
 
 from ..lon_ import BN
 
@@ -228,6 +228,9 @@ class U2B:
         "\u007d": BN.anusvara,  # \u007d -> } : ং
     }
 
+    # charmap keys in decreasing length, the order in which they are mapped
+    sorted_keys: List[str] = sorted(charmap.keys(), key=len, reverse=True)
+
     R_char_r: Dict[str, str] = {
         "\u00a2": f"{BN.ra}{BN.virama}",  # \u00a2 -> ¢ : BN.ra{BN.virama} -> র্
     }
@@ -9,8 +9,8 @@ from .phoneme import (
 )
 from .mm import MM
 from .bn import BN
-from .plot import plot_ssp
 from .cleaner import Cleaner
+from .bulk import BulkCleaner
 
 __all__ = [
     "PoA",
@@ -23,5 +23,16 @@ __all__ = [
     "MM",
     "BN",
     "Cleaner",
+    "BulkCleaner",
     "plot_ssp",
+    "plot_ssp_summary",
 ]
+
+
+def __getattr__(name: str):
+    # The plots pull in matplotlib and numpy, so they are only imported on access.
+    if name in ("plot_ssp", "plot_ssp_summary"):
+        from . import plot
+
+        return getattr(plot, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,117 @@
+import re
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+from .bn import BN
+from .cleaner import (
+    BN_CLEAN_RULES,
+    BN_RARE_ERRORS,
+    BN_RARE_ERRORS_AND_DIGITS,
+    MM_DIGITS,
+    MM_DIPHTHONGS,
+    MM_FIRST_REPETITION,
+    MM_NUNG,
+    TRANSCRIBED_ERRORS,
+)
+from .mm import MM
+
+if TYPE_CHECKING:
+    from ..mt_base_.transducer import Transducer
+
+# Rules of every cleaning step (in order), compiled on first use
+RULES: Dict[str, List[Dict[str, str]]] = {
+    "bn_clean": BN_CLEAN_RULES,
+    "bn_rare": [BN_RARE_ERRORS],
+    "bn_rare_digits": [BN_RARE_ERRORS_AND_DIGITS],
+    "mm_digits": [MM_DIGITS],
+    # fix_diphthong and fix_nung only skip words their rules cannot match
+    "mm_clean": [MM_FIRST_REPETITION, MM_DIPHTHONGS, MM_NUNG],
+    "transcribed": [TRANSCRIBED_ERRORS],
+}
+
+# Everything out of the alphabet ranges of BNHelper/MMHelper.has_char
+BN_OTHERS = re.compile(f"[^{BN.candrabindu}-{BN.w}\n]+")
+MM_OTHERS = re.compile(f"[^{MM.kok}-{MM.nine}\n]+")
+BN_LEADING_VIRAMA = re.compile(f"^{BN.virama}", re.M)
+NGOU_LONSUM_WORD = re.compile(f"^.*{MM.ngou_lonsum}.*$", re.M)
+NGOU_LONSUM_AFTER_NON_VOWEL = re.compile(
+    f"(?<=[^{''.join(sorted(MM.cheitap_set_V))}]){MM.ngou_lonsum}"
+)
+
+
+class BulkCleaner:
+    """
+    Cleaner on whole corpus buffers of one word per line.
+
+    Every line comes out as the per-word Cleaner method of the same name
+    would clean it. The replacement rules are the ones of Cleaner, compiled
+    into single-scan passes (str.translate or one regex) that run over the
+    whole buffer at C speed; the alphabet filters are one regex each.
+
+    Usage:
+        text = BulkCleaner.deepclean_bn_utf("\\n".join(words))
+        words_mm = BulkCleaner.clean_words(BulkCleaner.clean_mm_utf, words_mm)
+    """
+
+    _transducers: Dict[str, "Transducer"] = {}
+
+    @classmethod
+    def transducer(cls, name: str) -> "Transducer":
+        if name not in cls._transducers:
+            # mt_base_ imports lon_, so the transducer is imported on use
+            from ..mt_base_.transducer import Transducer
+
+            rules = [rule for mapping in RULES[name] for rule in mapping.items()]
+            cls._transducers[name] = Transducer(rules)
+        return cls._transducers[name]
+
+    @staticmethod
+    def clean_words(func: Callable[[str], str], words: List[str]) -> List[str]:
+        """Clean a list of words (without newlines) with a BulkCleaner method."""
+        return func("\n".join(words)).split("\n")
+
+    # MM
+    @classmethod
+    def deepclean_mm_utf(cls, text: str, allow_digits: bool = False) -> str:
+        if not allow_digits:
+            text = cls.transducer("mm_digits").apply(text)
+        return cls.clean_mm_utf(text)
+
+    @classmethod
+    def clean_mm_utf(cls, text: str) -> str:
+        text = cls.transducer("mm_clean").apply(text)
+        return NGOU_LONSUM_WORD.sub(cls.__fix_ngou_lonsum, text)
+
+    @staticmethod
+    def __fix_ngou_lonsum(match: re.Match) -> str:
+        word = match.group()
+        fixed = NGOU_LONSUM_AFTER_NON_VOWEL.sub(MM.nung, word)
+        # Cleaner.fix_ngou_lonsum compares a leading ngou lonsum with word[-1]
+        if word[0] == MM.ngou_lonsum and word[-1] not in MM.cheitap_set_V:
+            fixed = MM.nung + fixed[1:]
+        return fixed.replace(MM.nung + MM.apun_iyek, MM.nung)
+
+    @staticmethod
+    def filter_mm_utf(text: str) -> str:
+        return MM_OTHERS.sub("", text)
+
+    # BN
+    @classmethod
+    def deepclean_bn_utf(cls, text: str, allow_digits: bool = False) -> str:
+        text = BN_LEADING_VIRAMA.sub("", cls.clean_bn_utf(text))
+        text = cls.transducer("bn_rare" if allow_digits else "bn_rare_digits").apply(
+            text
+        )
+        return cls.filter_bn_utf(text)
+
+    @classmethod
+    def clean_bn_utf(cls, text: str) -> str:
+        return cls.filter_bn_utf(cls.transducer("bn_clean").apply(text))
+
+    @staticmethod
+    def filter_bn_utf(text: str) -> str:
+        return BN_OTHERS.sub("", text)
+
+    ## Transcription/Transliteration Error
+    @classmethod
+    def clean_transcribed_utf(cls, text: str) -> str:
+        return cls.filter_mm_utf(cls.transducer("transcribed").apply(text))
@@ -155,6 +155,15 @@ class PhonemeInventory:
         feats_vowels (Dict[str, Tuple[int, int, bool]]): Features for vowel phonemes.
     """
 
+    _shared: "PhonemeInventory | None" = None
+
+    @classmethod
+    def shared(cls) -> "PhonemeInventory":
+        """Process-wide inventory used by the engines (treat it as read-only)."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
     def __init__(self) -> None:
         """Initialize the Meetei Mayek phoneme inventory."""
         consonant_ipa: Dict[Phoneme, List[str]] = {
@@ -375,6 +384,18 @@ class PhonemeInventory:
         """Get Parker SSP value and name for a given character."""
         return self._get_ssp(chars, 1, self.ssp_parker)
 
+    def get_sonority(self, phoneme: str, parker: bool = False) -> int:
+        """Sievers (or Parker) sonority value of a phoneme.
+
+        Vowels are one above the highest consonant class of the scale, other
+        tokens (e.g. the virama) are -1.
+        """
+        if phoneme in self.feats_consonants:
+            return self.feats_consonants[phoneme][0][int(parker)].value
+        if phoneme in self.phoneme_set_V:
+            return max(member.value for member in (Parker if parker else Sievers)) + 1
+        return -1
+
     def get_sievers(self, consonant_phoneme: str) -> Sievers:
         """Get Sievers ssp value."""
         return self.__get_specific(consonant_phoneme, 0, 0)
@@ -529,3 +550,5 @@ class ARPABETPhoneme:
             if attr.startswith("phoneme_"):
                 content = attr.split("_", 1)[1]
                 setattr(self, attr, content)
+        # /h/ is the only phoneme whose 2 letter code is not its name
+        self.phoneme_H = "HH"
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from matplotlib import pyplot as plt
 import numpy as np
 from .phoneme import PhonemeInventory
@@ -22,12 +22,7 @@ def plot_ssp(words_in_phonemes: List[str]) -> None:
         row = i // 2
         col = i % 2
 
-        sonority_values = [
-            mmP.get_sievers(
-                phoneme,
-            )[0]
-            for phoneme in phonemes
-        ]
+        sonority_values = [mmP.get_sonority(phoneme) for phoneme in phonemes]
         y = np.array(sonority_values)
 
         phoneme_labels = [f"{i}/{phoneme}" for i, phoneme in enumerate(phonemes)]
@@ -36,3 +31,59 @@ def plot_ssp(words_in_phonemes: List[str]) -> None:
 
     plt.tight_layout()
     plt.show()
+
+
+def plot_ssp_summary(summary: Dict, top: int = 15) -> None:
+    """
+    Plot corpus SSP statistics (SSPAnalytics.summary() of src.mt_).
+
+    Plots the most common syllable contours and violating clusters, and the
+    sonority histograms by position in the syllable and by offset from its peak
+    (each row normalised).
+
+    Args:
+    - summary (Dict): SSPAnalytics.summary() output.
+    - top (int): Number of contours and clusters to show.
+
+    Returns:
+    - None
+    """
+    fig, axes = plt.subplots(2, 2, figsize=(14, 9))
+    fig.suptitle(
+        f"{summary['syllables']:,} syllables of {summary['words']:,} words | "
+        f"{summary['violation_rate']:.1%} violate SSP ({summary['scale']})"
+    )
+
+    contours = summary["contours"][:top][::-1]
+    axes[0, 0].barh(
+        ["-".join(map(str, contour)) for contour, _ in contours],
+        [count for _, count in contours],
+    )
+    axes[0, 0].set_title("Syllable contours (sonority)")
+
+    violations = summary["violations"][:top][::-1]
+    axes[0, 1].barh(
+        [f"{first} {second} ({side})" for (first, second, side), _ in violations],
+        [count for _, count in violations],
+    )
+    axes[0, 1].set_title("Violating clusters")
+
+    num_offsets = len(summary["offsets"])
+    for ax, name, first, title, ylabel in (
+        (axes[1, 0], "positions", 0, "by position (last: and beyond)", "position"),
+        (axes[1, 1], "offsets", -(num_offsets // 2), "around the peak", "offset"),
+    ):
+        counts = summary[name].astype(float)
+        totals = counts.sum(axis=1, keepdims=True)
+        ax.imshow(
+            np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0),
+            aspect="auto",
+            cmap="viridis",
+        )
+        ax.set_yticks(range(len(counts)), [str(first + i) for i in range(len(counts))])
+        ax.set_title(f"Sonority {title}")
+        ax.set_ylabel(ylabel)
+        ax.set_xlabel("sonority")
+
+    plt.tight_layout()
+    plt.show()
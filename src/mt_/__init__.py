@@ -1,24 +1,67 @@
-from typing import List
+from typing import Iterator, List
 
 
-from ..lon_ import Cleaner
+from ..lon_ import Cleaner, PhonemeInventory
+from ..perf_ import RuleCounter, StageMetrics, StageTimer, TailSampler
+from ..wordmap_ import Lexicon
+from .cache import SuffixCache, WordCache
 from .conversion import PhonemeConvertor
+from .runs import BN_RUN
+from .session import DocumentSession, Patch
 from .syllabification import Syllabification
 from .spelling import Spelling
+from .trace import TransliterationTrace
 
 __all__ = [
+    "BatchSyllabification",
+    "DocumentSession",
     "MTransliteration",
+    "Patch",
     "PhonemeConvertor",
     "Syllabification",
     "Spelling",
+    "SSPAnalytics",
+    "SuffixCache",
+    "TransliterationTrace",
+    "WordCache",
 ]
 
 
+def __getattr__(name: str):
+    # These pull in numpy, so they are only imported on access.
+    if name == "BatchSyllabification":
+        from .vectorized import BatchSyllabification
+
+        return BatchSyllabification
+    if name == "SSPAnalytics":
+        from .ssp import SSPAnalytics
+
+        return SSPAnalytics
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class MTransliteration:
-    def __init__(self) -> None:
-        self.pc = PhonemeConvertor()
-        self.syllabification = Syllabification()
-        self.spelling = Spelling()
+    def __init__(
+        self,
+        metrics: StageMetrics | None = None,
+        tail: TailSampler | None = None,
+        rules: RuleCounter | None = None,
+        lexicon: Lexicon | None = None,
+        pi: PhonemeInventory | None = None,
+        cache: WordCache | None = None,
+    ) -> None:
+        # One inventory for all stages (the process-wide one by default)
+        pi = pi if pi is not None else PhonemeInventory.shared()
+        self.pc = PhonemeConvertor(counter=rules, pi=pi)
+        self.syllabification = Syllabification(counter=rules, pi=pi)
+        self.spelling = Spelling(pi=pi)
+        # Optional per-stage instrumentation and slow word capture
+        self.metrics = metrics
+        self.tail = tail
+        # Optional gold lexicon, looked up before the rule engine
+        self.lexicon = lexicon
+        # Optional word cache (SuffixCache, or SharedCache across processes)
+        self.cache = cache
 
     def transliterate_words(
         self,
@@ -31,48 +74,108 @@ class MTransliteration:
             words.append(self.transliterate(word=word, show_steps=show_steps))
         return "\n".join(words)
 
+    def transliterate_text(self, text: str) -> str:
+        """Transliterate the Bengali runs of mixed text in place.
+
+        Everything else (other scripts, digits, punctuation, whitespace) is
+        copied as it is, so the layout of the text is kept.
+        """
+        return BN_RUN.sub(lambda match: self.transliterate_run(match.group()), text)
+
+    def transliterate_run(self, run: str) -> str:
+        """Transliterate one run of Bengali characters (see `transliterate_text`)."""
+        return self.transliterate(run)
+
     def transliterate(
         self,
         word: str,
         show_steps: bool = False,
         sep: str = "/",
     ) -> str:
+        # Lexicon-first mode: exact hits skip the rule engine
+        if self.lexicon is not None and not show_steps:
+            word_mm = self.lexicon.get(word)
+            if word_mm is not None:
+                return word_mm
+        if self.cache is not None and not show_steps:
+            return self.cache.get(word, self.__pipeline)
+        trace = self.trace(word)
+        return trace.to_tsv(sep=sep) if show_steps else trace.output
+
+    def session(self, text: str = "") -> DocumentSession:
+        """Incremental session over an edited document (see DocumentSession)."""
+        return DocumentSession(self.transliterate_run, text)
+
+    def __pipeline(self, word: str) -> str:
+        return self.trace(word).output
+
+    def trace_words(self, text: str) -> Iterator[TransliterationTrace]:
+        """Lazily trace every word of the text."""
+        return (self.trace(word) for word in text.split())
+
+    def trace(self, word: str) -> TransliterationTrace:
+        timer = (
+            StageTimer(self.metrics, len(word))
+            if self.metrics is not None or self.tail is not None
+            else None
+        )
+        word_raw = word
+
         # 0. Clean input text
         word = Cleaner.deepclean_bn_utf(word)
-        res = ""
+        if timer:
+            timer.lap("clean")
 
         # 0.1 Skip other process if string is empty
         if not word.strip():
-            return ""
+            trace = TransliterationTrace(word_raw, word, [], [], [], [], [], "")
+            if timer:
+                self.__sample_tail(trace, timer)
+            return trace
 
         # 1.1. Phoneme Conversion
         # Prepare phoneme sequence and character sequence
         phoneme_seq, char_seq = self.pc.extract_seq(word)
+        if timer:
+            timer.lap("extract_seq")
 
         # 1.2. Syllabification
         # Get split points
         split_tags = self.syllabification.get_split_tags(char_seq, phoneme_seq)
 
         syl_chars = self.pc.split_seq_by_bool(char_seq, split_tags)
-
-        if show_steps:
-            syl_phonemes = self.pc.split_seq_by_bool(phoneme_seq, split_tags, sep=".")
-            res += f"{sep.join(syl_chars)}\t{sep.join(syl_phonemes)}\t"
+        if timer:
+            timer.lap("syllabification")
 
         # 2.1. Phoneme Conversion
         # Prepare phoneme list and characters list (includes diphthongs)
         sup_phonemes: List[List[str]] = self.pc.split_more(
             [self.pc.prepare_syllable_phoneme(syllable) for syllable in syl_chars]
         )
-
-        if show_steps:
-            syl_phonemes = [".".join(phonemes) for phonemes in sup_phonemes]
-            res += f"{sep.join(syl_phonemes)}\t"
+        if timer:
+            timer.lap("split_more")
 
         # 2.2. Spelling
         # Get words in mm from the syllables
         chars_mm = self.spelling.spell(sup_phonemes)
 
-        res += "".join(chars_mm)
+        trace = TransliterationTrace(
+            word_raw,
+            word,
+            char_seq,
+            phoneme_seq,
+            split_tags,
+            syl_chars,
+            sup_phonemes,
+            "".join(chars_mm),
+        )
+        if timer:
+            timer.lap("spelling")
+            self.__sample_tail(trace, timer)
+
+        return trace
 
-        return res
+    def __sample_tail(self, trace: TransliterationTrace, timer: StageTimer) -> None:
+        seconds = timer.stop()
+        if self.tail is not None and self.tail.is_slow(seconds):
+            self.tail.record(trace.word, seconds, timer.laps, trace.to_dict())
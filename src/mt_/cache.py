@@ -0,0 +1,136 @@
+from collections import Counter
+from typing import Callable, Dict, Iterable, Protocol, Tuple
+
+from ..lon_ import BN, Cleaner
+
+# Frequent inflectional suffixes of data/transcribed.txt that start with a
+# consonant + vowel sign (stacked suffixes are also found recursively, e.g.
+# শিং + বু, and দগী is composed as দ + গী)
+SUFFIXES: Tuple[str, ...] = (
+    "গী", "না", "দা", "শিং", "বা", "সু", "গা", "নি", "বু", "কী", "তা", "দি",
+    "দুনা", "কা", "দু", "শিংগী", "শিংদা", "শিংনা", "শিংগা", "শিংবু", "শিংসু",
+    "গীদমক", "খি", "খিবা", "দো", "পু", "সি",
+)  # fmt: skip
+# Suffix onsets that never join the stem (/H/ splits, য and য় form diphthongs)
+ONSET_CONSONANTS = BN.main_set_C - {BN.h, BN.ya, BN.yya}
+
+
+class WordCache(Protocol):
+    """Word cache used by MTransliteration (SuffixCache, shared_.SharedCache)."""
+
+    def get(self, word: str, pipeline: Callable[[str], str]) -> str: ...
+
+
+class SuffixCache:
+    """
+    Word cache that composes unseen inflected forms from their stem.
+
+    A word ending with a known suffix is split into stem + suffix and composed
+    as transliterate(stem) + transliterate(suffix), only at a boundary the
+    pipeline cannot see across:
+    - the suffix starts with one consonant and a vowel sign (the vowel sign
+      rule always splits the syllables before that consonant), and has no
+      virama,
+    - the stem has no virama in its last 3 characters (the cluster rules look
+      2 characters ahead of a virama),
+    - the stem and the suffix are already clean (deepclean_bn_utf keeps them
+      as they are), and no cleaning rule spans a boundary without a virama.
+    The syllables of the word are then those of the stem followed by those of
+    the suffix, and every syllable is spelt on its own, so the composed output
+    is the pipeline output. Other words (and suffixes) go to the pipeline;
+    `verify=True` also runs the pipeline on composed words and counts
+    mismatches.
+
+    Usage:
+        cache = SuffixCache()
+        mt = MTransliteration(cache=cache)
+        mt.transliterate_words(content)
+        cache.stats()  # hits, composed, pipeline, ...
+    """
+
+    def __init__(
+        self,
+        suffixes: Iterable[str] = SUFFIXES,
+        min_stem: int = 2,
+        max_words: int | None = 1000000,
+        verify: bool = False,
+    ) -> None:
+        self.suffixes = sorted(
+            filter(SuffixCache.is_suffix, set(suffixes)), key=len, reverse=True
+        )
+        self.min_stem = min_stem
+        self.max_words = max_words
+        # Also run the pipeline on composed words and count mismatches
+        self.verify = verify
+        self.words: Dict[str, str] = {}
+        self.reset()
+
+    @staticmethod
+    def is_suffix(suffix: str) -> bool:
+        """Whether a suffix starts a new syllable whatever the stem."""
+        return (
+            len(suffix) > 1
+            and suffix[0] in ONSET_CONSONANTS
+            and suffix[1] in BN.fi_set_V
+            and BN.virama not in suffix
+            and Cleaner.deepclean_bn_utf(suffix) == suffix
+        )
+
+    @staticmethod
+    def is_stem(stem: str) -> bool:
+        """Whether a stem ends where the pipeline cannot see the suffix."""
+        return BN.virama not in stem[-3:] and Cleaner.deepclean_bn_utf(stem) == stem
+
+    def get(self, word: str, pipeline: Callable[[str], str]) -> str:
+        """Output of `word`, from the cache, composed or from `pipeline`."""
+        word_mm, path = self.__lookup(word, pipeline)
+        self.paths[path] += 1
+        return word_mm
+
+    def __lookup(self, word: str, pipeline: Callable[[str], str]) -> Tuple[str, str]:
+        word_mm = self.words.get(word)
+        if word_mm is not None:
+            return word_mm, "hit"
+        for suffix in self.suffixes:
+            if len(word) - len(suffix) < self.min_stem or not word.endswith(suffix):
+                continue
+            stem = word[: -len(suffix)]
+            if not SuffixCache.is_stem(stem):
+                continue
+            word_mm = (
+                self.__lookup(stem, pipeline)[0] + self.__lookup(suffix, pipeline)[0]
+            )
+            self.suffix_counts[suffix] += 1
+            if self.verify and self.__run(word, pipeline) != word_mm:
+                self.mismatches += 1
+            return self.__store(word, word_mm), "composed"
+        return self.__store(word, self.__run(word, pipeline)), "pipeline"
+
+    def __run(self, word: str, pipeline: Callable[[str], str]) -> str:
+        self.pipeline_runs += 1
+        return pipeline(word)
+
+    def __store(self, word: str, word_mm: str) -> str:
+        if self.max_words is None or len(self.words) < self.max_words:
+            self.words[word] = word_mm
+        return word_mm
+
+    def stats(self) -> Dict[str, int | float]:
+        """Path of every requested word (the pipeline also runs for the stems
+        and the suffixes)."""
+        total = sum(self.paths.values())
+        return {
+            "hits": self.paths["hit"],
+            "composed": self.paths["composed"],
+            "pipeline": self.paths["pipeline"],
+            "hit_rate": (total - self.paths["pipeline"]) / total if total else 0.0,
+            "pipeline_runs": self.pipeline_runs,
+            "mismatches": self.mismatches,
+        }
+
+    def reset(self) -> None:
+        """Reset the counters (the cached words are kept)."""
+        self.paths: Counter = Counter()
+        self.suffix_counts: Counter = Counter()
+        self.pipeline_runs = 0
+        self.mismatches = 0
@@ -1,15 +1,25 @@
 from typing import Dict, List, Set, Tuple
 
 from ..lon_ import Phoneme, PhonemeInventory, BN
+from ..perf_ import RuleCounter
+
+# Rule names of the extract_seq branches (in order) for RuleCounter
+EXTRACT_RULES = ("skip", "diphthong", "bophala", "r_vocalic", "default")
 
 
 class PhonemeConvertor:
 
-    def __init__(self) -> None:
-        self.pi = PhonemeInventory()
+    def __init__(
+        self,
+        counter: RuleCounter | None = None,
+        pi: PhonemeInventory | None = None,
+    ) -> None:
+        # Optional rule firing counter
+        self.counter = counter
+        self.pi = pi if pi is not None else PhonemeInventory.shared()
         self.phoneme_set = self.pi.phoneme_set_all
         self.phoneme_set_C = self.pi.phoneme_set_C
-        self.sorted_keys = sorted(B2P.charmap.keys(), key=len, reverse=True)
+        self.sorted_keys = B2P.sorted_keys
 
     def extract_seq(
         self, text: str, allow_multiple: bool = False
@@ -27,17 +37,23 @@ class PhonemeConvertor:
         phoneme_seq, char_seq = [], []
         skip = 0
         last_idx = len(text) - 1
+        counter = self.counter
         for i, char in enumerate(text):
             if skip > 0:
+                rule = "skip"
                 skip -= 1
             # Take two
             elif text[i : i + 2] in BN.in_diphthong_set | BN.fi_diphthong_set:
+                rule = "diphthong"
                 # when y is not part of a diphthong
-                if (
+                is_glide = (
                     i < last_idx - 1
                     and text[i + 1] in [BN.ya, BN.yya]
                     and text[i + 2] in BN.fi_set_V | BN.fi_set_C
-                ):
+                )
+                if counter is not None:
+                    counter.check("diphthong_glide", is_glide)
+                if is_glide:
                     phoneme_seq.append(B2P.charmap[char])
                     char_seq.append(char)
                 # for all diphthongs
@@ -64,18 +80,23 @@ class PhonemeConvertor:
                     BN.pa,
                 }
             ):
+                rule = "bophala"
                 phoneme_seq.append(Phoneme.w.value)
                 char_seq.append(char)
             # For r vocalic
             elif char == BN.v_r_vocalic:
+                rule = "r_vocalic"
                 if allow_multiple:
                     phoneme_seq.extend([BN.virama, Phoneme.r.value, Phoneme.i.value])
                 else:
                     phoneme_seq.append(Phoneme.r.value)
                 char_seq.append(char)
             else:
+                rule = "default"
                 phoneme_seq.append(B2P.charmap.get(char, char))
                 char_seq.append(char)
+            if counter is not None:
+                counter.chain(EXTRACT_RULES, rule)
 
         return phoneme_seq, char_seq
 
@@ -136,7 +157,11 @@ class PhonemeConvertor:
                 num_v = 0
 
         word_phonemes = self.group_by_bool(phoneme_seq, is_split)
-        return word_phonemes[1:] if word_phonemes[0] == BN.virama else word_phonemes
+        return (
+            word_phonemes[1:]
+            if word_phonemes and word_phonemes[0] == BN.virama
+            else word_phonemes
+        )
 
     @staticmethod
     def split_seq_by_bool(
@@ -250,3 +275,5 @@ class B2P:
         for phoneme, char_bn_list in p2b_charmap.items()
         for char_bn in char_bn_list
     }
+
+    sorted_keys: List[str] = sorted(charmap.keys(), key=len, reverse=True)
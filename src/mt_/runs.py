@@ -0,0 +1,15 @@
+import re
+
+from ..lon_ import BN
+
+ZWNJ, ZWJ = "\u200c", "\u200d"
+# Runs of Bengali letters and signs (digits excluded), with joiners inside a run
+BN_CHARS = f"{BN.candrabindu}-{chr(ord(BN.zero) - 1)}{chr(ord(BN.nine) + 1)}-{BN.w}"
+BN_RUN = re.compile(f"[{BN_CHARS}](?:[{BN_CHARS}{ZWNJ}{ZWJ}]*[{BN_CHARS}])?")
+# Every character a run can contain: no run crosses the position between two
+# characters unless both are in this set
+RUN_CHARS = frozenset(
+    chr(code)
+    for code in range(ord(BN.candrabindu), ord(BN.w) + 1)
+    if not BN.zero <= chr(code) <= BN.nine
+) | {ZWNJ, ZWJ}
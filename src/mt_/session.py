@@ -0,0 +1,273 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, List, NamedTuple, Tuple
+
+from .runs import BN_RUN, RUN_CHARS
+
+# Text between runs is kept in pieces of at most GAP_SIZE characters, so an
+# edit never copies more than one of them on each side
+GAP_SIZE = 256
+# Characters read at a time when widening an edit over run characters
+WINDOW = 64
+RUN_CHARS_STR = "".join(sorted(RUN_CHARS))
+
+
+class Patch(NamedTuple):
+    """Replace output[start:end] of the previous version by `text`."""
+
+    start: int
+    end: int
+    text: str
+
+
+def common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix (binary search over C-level comparisons)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix, at most `limit`."""
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid : len(a) - lo] == b[len(b) - mid : len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class DocumentSession:
+    """
+    Incremental transliteration of a document that is edited over time.
+
+    The output is always `MTransliteration.transliterate_text(text)`: Bengali
+    runs are transliterated and everything else is copied. The session keeps
+    the document as pieces: the runs with their outputs, and the text between
+    them (in pieces of at most GAP_SIZE characters). An edit only re-scans the
+    pieces it touches, widened to the Bengali stretches around it, splices the
+    new pieces in and only transliterates the runs found there (outputs of
+    the `memo_size` most recently used runs are reused).
+
+    Offsets of the pieces after the last edit are shifted lazily (as in a gap
+    buffer), so an edit costs the size of the change plus the number of pieces
+    between it and the previous edit, not the size of the document. `text`
+    and `output` are joined from the pieces when they are read.
+
+    Usage:
+        session = mt.session(text)
+        session.output
+        patch = session.update(new_text)  # or session.edit(start, end, text)
+        output = output[: patch.start] + patch.text + output[patch.end :]
+    """
+
+    def __init__(
+        self,
+        transliterate_run: Callable[[str], str],
+        text: str = "",
+        memo_size: int = 100000,
+    ) -> None:
+        self.transliterate_run = transliterate_run
+        # Pieces of the current text, their outputs and offsets
+        self.pieces: List[str] = []
+        self.outs: List[str] = []
+        self.is_run: List[bool] = []
+        self.starts: List[int] = []
+        self.out_starts: List[int] = []
+        self.length = 0
+        self.out_length = 0
+        # Offsets from piece `gap` on are stale by `shift` and `out_shift`
+        self.gap = 0
+        self.shift = 0
+        self.out_shift = 0
+        # Outputs by run (least recently used first), shared by every version
+        self.memo: OrderedDict[str, str] = OrderedDict()
+        self.memo_size = memo_size
+        self.num_transliterated = 0
+        # Joined text and output, until the next edit
+        self._text: str | None = ""
+        self._output: str | None = ""
+        if text:
+            self.update(text)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "".join(self.pieces)
+        return self._text
+
+    @property
+    def output(self) -> str:
+        if self._output is None:
+            self._output = "".join(self.outs)
+        return self._output
+
+    def update(self, text: str) -> Patch:
+        """Replace the document by a new version (diffed against the last one)."""
+        old_text = self.text
+        start = common_prefix(old_text, text)
+        suffix = common_suffix(old_text, text, min(len(old_text), len(text)) - start)
+        patch = self.__apply(
+            start, len(old_text) - suffix, text[start : len(text) - suffix]
+        )
+        self._text = text
+        return patch
+
+    def edit(self, start: int, end: int, text: str) -> Patch:
+        """Replace text[start:end] by `text` (known edit, no diff needed)."""
+        return self.__apply(start, end, text)
+
+    def __apply(self, start: int, end: int, text: str) -> Patch:
+        # Widen the edit to positions no run can cross (before and after it)
+        a, b = self.__widen_left(start), self.__widen_right(end)
+        # Pieces p..q-1 cover the region; runs never cross a or b, so the
+        # pieces sticking out of it are text between runs
+        p = self.__count(a) - 1
+        if p < 0 or a >= self.__start(p) + len(self.pieces[p]):
+            p += 1
+        q = self.__count(b - 1) if b > 0 else 0
+        q = max(p, q)
+        self.__move_gap(p)
+        region_start = self.__start(p) if p < len(self.pieces) else self.length
+        region_end = (
+            self.__start(q - 1) + len(self.pieces[q - 1]) if q > p else region_start
+        )
+        out_start = self.__out_start(p) if p < len(self.pieces) else self.out_length
+        out_end = self.__out_start(q) if q < len(self.pieces) else self.out_length
+        region = (
+            self.__slice(region_start, start) + text + self.__slice(end, region_end)
+        )
+
+        pieces, outs, is_run, starts, out_starts = [], [], [], [], []
+        pos, out_pos = region_start, out_start
+
+        def add(piece: str, output: str, run: bool) -> None:
+            nonlocal pos, out_pos
+            pieces.append(piece)
+            outs.append(output)
+            is_run.append(run)
+            starts.append(pos)
+            out_starts.append(out_pos)
+            pos += len(piece)
+            out_pos += len(output)
+
+        last = 0
+        for match in BN_RUN.finditer(region):
+            for i in range(last, match.start(), GAP_SIZE):
+                gap = region[i : min(i + GAP_SIZE, match.start())]
+                add(gap, gap, False)
+            run = match.group()
+            add(run, self.__transliterate(run), True)
+            last = match.end()
+        for i in range(last, len(region), GAP_SIZE):
+            gap = region[i : i + GAP_SIZE]
+            add(gap, gap, False)
+        patch = Patch(out_start, out_end, "".join(outs))
+
+        delta = len(region) - (region_end - region_start)
+        out_delta = len(patch.text) - (out_end - out_start)
+        self.pieces[p:q] = pieces
+        self.outs[p:q] = outs
+        self.is_run[p:q] = is_run
+        self.starts[p:q] = starts
+        self.out_starts[p:q] = out_starts
+        # Pieces after the region move by delta (applied lazily)
+        self.gap = p + len(pieces)
+        self.shift += delta
+        self.out_shift += out_delta
+        self.length += delta
+        self.out_length += out_delta
+        self._text = self._output = None
+        return patch
+
+    def __transliterate(self, run: str) -> str:
+        output = self.memo.get(run)
+        if output is not None:
+            self.memo.move_to_end(run)
+            return output
+        output = self.memo[run] = self.transliterate_run(run)
+        self.num_transliterated += 1
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(last=False)
+        return output
+
+    def __widen_left(self, pos: int) -> int:
+        """Start of the run characters that end at `pos`."""
+        while pos > 0:
+            window = self.__slice(max(pos - WINDOW, 0), pos)
+            kept = len(window.rstrip(RUN_CHARS_STR))
+            if kept:
+                return pos - len(window) + kept
+            pos -= len(window)
+        return 0
+
+    def __widen_right(self, pos: int) -> int:
+        """End of the run characters that start at `pos`."""
+        while pos < self.length:
+            window = self.__slice(pos, min(pos + WINDOW, self.length))
+            kept = len(window.lstrip(RUN_CHARS_STR))
+            if kept:
+                return pos + len(window) - kept
+            pos += len(window)
+        return self.length
+
+    def __slice(self, start: int, end: int) -> str:
+        """text[start:end], from the pieces it spans."""
+        if start >= end:
+            return ""
+        idx = self.__count(start) - 1
+        pos = self.__start(idx)
+        parts = []
+        while pos < end:
+            piece = self.pieces[idx]
+            parts.append(piece[max(start - pos, 0) : end - pos])
+            pos += len(piece)
+            idx += 1
+        return "".join(parts)
+
+    def __start(self, idx: int) -> int:
+        return self.starts[idx] + (self.shift if idx >= self.gap else 0)
+
+    def __out_start(self, idx: int) -> int:
+        return self.out_starts[idx] + (self.out_shift if idx >= self.gap else 0)
+
+    def __count(self, offset: int) -> int:
+        """Number of pieces starting at or before `offset`."""
+        idx = bisect_right(self.starts, offset, 0, self.gap)
+        if idx < self.gap:
+            return idx
+        return bisect_right(self.starts, offset - self.shift, self.gap)
+
+    def __move_gap(self, idx: int) -> None:
+        """Make the offsets before piece `idx` exact and the others stale."""
+        starts, out_starts = self.starts, self.out_starts
+        shift, out_shift = self.shift, self.out_shift
+        if idx > self.gap:
+            starts[self.gap : idx] = [x + shift for x in starts[self.gap : idx]]
+            out_starts[self.gap : idx] = [
+                x + out_shift for x in out_starts[self.gap : idx]
+            ]
+        elif idx < self.gap:
+            starts[idx : self.gap] = [x - shift for x in starts[idx : self.gap]]
+            out_starts[idx : self.gap] = [
+                x - out_shift for x in out_starts[idx : self.gap]
+            ]
+        self.gap = idx
+
+    def spans(self) -> List[Tuple[int, int, int, int]]:
+        """(start, end, out_start, out_end) of every run."""
+        spans = []
+        for idx, (piece, output) in enumerate(zip(self.pieces, self.outs)):
+            if self.is_run[idx]:
+                start, out_start = self.__start(idx), self.__out_start(idx)
+                spans.append(
+                    (start, start + len(piece), out_start, out_start + len(output))
+                )
+        return spans
@@ -5,8 +5,8 @@ from ..lon_ import Phoneme, PhonemeInventory, BN, MM, Cleaner
 
 class Spelling:
 
-    def __init__(self) -> None:
-        self.pi = PhonemeInventory()
+    def __init__(self, pi: PhonemeInventory | None = None) -> None:
+        self.pi = pi if pi is not None else PhonemeInventory.shared()
 
     def spell(
         self,
@@ -0,0 +1,225 @@
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+from ..lon_ import BulkCleaner, PhonemeInventory
+from .conversion import PhonemeConvertor
+from .vectorized import BatchSyllabification, Vocabulary
+
+# Phonemes of a syllable kept in its contour key (4 bits per sonority value)
+CONTOUR_LENGTH = 15
+
+
+def decode_contour(key: int) -> Tuple[int, ...]:
+    """Sonority values of a contour key (value + 1 per 4 bits, first lowest)."""
+    values = []
+    while key:
+        values.append((key & 15) - 1)
+        key >>= 4
+    return tuple(values)
+
+
+class SSPAnalytics:
+    """
+    Sonority Sequencing Principle (SSP) statistics over whole corpora.
+
+    Words are cleaned (BulkCleaner.deepclean_bn_utf, words with nothing left
+    are skipped), converted with PhonemeConvertor.extract_seq and split
+    into syllables with BatchSyllabification, one batch at a time, so any
+    number of words can be streamed through `update()`. The sonority of every
+    phoneme (PhonemeInventory.get_sonority, the virama is skipped) is looked
+    up as a NumPy array, and the statistics are aggregated per batch:
+    - contours: the sequence of sonority values of every syllable,
+    - violations: consonant pairs that do not rise towards the sonority peak
+      of their syllable (onset) or do not fall after it (coda),
+    - histograms of the sonority by position in the syllable and by offset
+      from its peak.
+    `summary()` returns plain counts and arrays, e.g. for plot_ssp_summary.
+
+    Usage:
+        ssp = SSPAnalytics()  # parker=True for the Parker scale
+        ssp.update_file("data/transcribed.txt")  # or ssp.update(words)
+        summary = ssp.summary(top=20)
+        plot_ssp_summary(summary)
+    """
+
+    def __init__(
+        self,
+        pi: PhonemeInventory | None = None,
+        parker: bool = False,
+        max_position: int = 8,
+        batch_size: int = 100000,
+    ) -> None:
+        self.pi = pi if pi is not None else PhonemeInventory.shared()
+        self.parker = parker
+        self.pc = PhonemeConvertor(pi=self.pi)
+        self.batch = BatchSyllabification(pi=self.pi)
+        self.phonemes = Vocabulary(
+            lambda phoneme: (self.pi.get_sonority(phoneme, parker=parker),)
+        )
+        # Sonority values 0..vowel (vowels are the top of the scale)
+        self.vowel = max(
+            self.pi.get_sonority(phoneme, parker=parker)
+            for phoneme in self.pi.phoneme_set_all
+        )
+        # Positions (and offsets) from max_position - 1 on share the last bin
+        self.max_position = max_position
+        self.batch_size = batch_size
+        self.reset()
+
+    def reset(self) -> None:
+        self.num_words = 0
+        self.num_skipped = 0
+        self.num_syllables = 0
+        self.num_phonemes = 0
+        self.num_violating = 0
+        # Sonority values of a syllable -> count
+        self.contours: Counter = Counter()
+        # (first phoneme, second phoneme, "onset" or "coda") -> count
+        self.violations: Counter = Counter()
+        self.positions = np.zeros((self.max_position, self.vowel + 1), dtype=np.int64)
+        self.offsets = np.zeros(
+            (2 * self.max_position - 1, self.vowel + 1), dtype=np.int64
+        )
+
+    def update_file(
+        self, file: str | Path, column: int = 0, delimiter: str = "\t"
+    ) -> None:
+        """Stream the Bengali words of a word list (`column` of every line)."""
+        with Path(file).open(encoding="utf-8") as f:
+            self.update(
+                line.split(delimiter)[column].strip() for line in f if line.strip()
+            )
+
+    def update(self, words: Iterable[str]) -> None:
+        """Add Bengali words (without newlines) to the statistics, `batch_size`
+        words at a time."""
+        words = iter(words)
+        while True:
+            batch = list(islice(words, self.batch_size))
+            if not batch:
+                break
+            char_seqs, phoneme_seqs = [], []
+            for word in BulkCleaner.clean_words(BulkCleaner.deepclean_bn_utf, batch):
+                if not word:
+                    # Nothing left after cleaning
+                    self.num_skipped += 1
+                    continue
+                phoneme_seq, char_seq = self.pc.extract_seq(word)
+                char_seqs.append(char_seq)
+                phoneme_seqs.append(phoneme_seq)
+            self.update_seqs(char_seqs, phoneme_seqs)
+
+    def update_seqs(
+        self,
+        char_seqs: Sequence[Sequence[str]],
+        phoneme_seqs: Sequence[Sequence[str]],
+    ) -> None:
+        """Add words given as the sequences of PhonemeConvertor.extract_seq."""
+        self.num_words += len(char_seqs)
+        if not char_seqs:
+            return
+        tags, lengths = self.batch.split_matrix(char_seqs, phoneme_seqs)
+        width = tags.shape[1] - 1
+        ids = self.phonemes.encode(phoneme_seqs, width)
+        sonority = self.phonemes.lookup(ids)[..., 0].astype(np.int64)
+        # Syllable index of every position (splits before it)
+        syllables = np.zeros(ids.shape, dtype=np.int64)
+        np.cumsum(tags[:, : width - 1], axis=1, out=syllables[:, 1:])
+        keep = (np.arange(width) < lengths[:, None]) & (sonority >= 0)
+        rows = np.nonzero(keep)[0]
+        syllables, sonority, ids = syllables[keep], sonority[keep], ids[keep]
+        if not len(ids):
+            return
+
+        # Phonemes of a syllable are contiguous (row-major order)
+        first = np.ones(len(ids), dtype=bool)
+        first[1:] = (rows[1:] != rows[:-1]) | (syllables[1:] != syllables[:-1])
+        starts = np.flatnonzero(first)
+        group = np.cumsum(first) - 1
+        position = np.arange(len(ids)) - starts[group]
+        # Peak: first phoneme with the highest sonority of the syllable
+        peak_value = np.maximum.reduceat(sonority, starts)
+        at_peak = np.where(sonority == peak_value[group], position, width)
+        peak = np.minimum.reduceat(at_peak, starts)[group]
+        self.num_syllables += len(starts)
+        self.num_phonemes += len(ids)
+
+        # Contours
+        digits = np.where(
+            position < CONTOUR_LENGTH,
+            (sonority + 1) << (4 * np.minimum(position, CONTOUR_LENGTH - 1)),
+            0,
+        )
+        keys, counts = np.unique(np.add.reduceat(digits, starts), return_counts=True)
+        self.contours.update(
+            {
+                decode_contour(key): count
+                for key, count in zip(keys.tolist(), counts.tolist())
+            }
+        )
+
+        # Consonant pairs against the direction of their side of the peak
+        pair = ~first[1:] & (sonority[:-1] < self.vowel) & (sonority[1:] < self.vowel)
+        onset = pair & (position[1:] <= peak[1:]) & (sonority[:-1] >= sonority[1:])
+        coda = pair & (position[:-1] >= peak[:-1]) & (sonority[:-1] <= sonority[1:])
+        self.num_violating += len(np.unique(group[1:][onset | coda]))
+        tokens = [""] + list(self.phonemes)
+        for side, violating in (("onset", onset), ("coda", coda)):
+            pairs, counts = np.unique(
+                np.stack([ids[:-1][violating], ids[1:][violating]], axis=1),
+                axis=0,
+                return_counts=True,
+            )
+            self.violations.update(
+                {
+                    (tokens[a], tokens[b], side): count
+                    for (a, b), count in zip(pairs.tolist(), counts.tolist())
+                }
+            )
+
+        # Histograms
+        bins = self.vowel + 1
+        last = self.max_position - 1
+        offset = np.clip(position - peak, -last, last) + last
+        position = np.minimum(position, last)
+        self.positions += np.bincount(
+            position * bins + sonority, minlength=self.positions.size
+        ).reshape(self.positions.shape)
+        self.offsets += np.bincount(
+            offset * bins + sonority, minlength=self.offsets.size
+        ).reshape(self.offsets.shape)
+
+    def merge(self, other: "SSPAnalytics") -> None:
+        """Add the statistics of another instance (e.g. of another shard)."""
+        self.num_words += other.num_words
+        self.num_skipped += other.num_skipped
+        self.num_syllables += other.num_syllables
+        self.num_phonemes += other.num_phonemes
+        self.num_violating += other.num_violating
+        self.contours.update(other.contours)
+        self.violations.update(other.violations)
+        self.positions += other.positions
+        self.offsets += other.offsets
+
+    def summary(self, top: int = 20) -> Dict:
+        """Counts, the `top` contours and violating clusters, and histograms."""
+        return {
+            "scale": "parker" if self.parker else "sievers",
+            "words": self.num_words,
+            "skipped": self.num_skipped,
+            "syllables": self.num_syllables,
+            "phonemes": self.num_phonemes,
+            "violating_syllables": self.num_violating,
+            "violation_rate": (
+                self.num_violating / self.num_syllables if self.num_syllables else 0.0
+            ),
+            "contours": self.contours.most_common(top),
+            "violations": self.violations.most_common(top),
+            # [position or offset + max_position - 1, sonority] -> count
+            "positions": self.positions.copy(),
+            "offsets": self.offsets.copy(),
+        }
@@ -1,11 +1,30 @@
 from typing import List, Tuple
 
 from ..lon_ import BN, Phoneme, PhonemeInventory, PoA, MoA, Sievers
+from ..perf_ import RuleCounter
+
+# Rule names of the if/elif chains (in order) for RuleCounter
+CHAR_RULES = ("independent_vowel", "dependent_vowel", "dependent_consonant")
+INVALID_CLUSTER_RULES = (
+    "same_phoneme",
+    "vccv",
+    "iv_nasal_plosive",
+    "plosive_plosive_nasal",
+    "nasal_plosive_v",
+    "glide_liquid",
+)
+ONSET_CLUSTER_RULES = ("s_glide_rhotic_onset", "glide_rhotic_onset")
 
 
 class Syllabification:
-    def __init__(self) -> None:
-        self.pi = PhonemeInventory()
+    def __init__(
+        self,
+        counter: RuleCounter | None = None,
+        pi: PhonemeInventory | None = None,
+    ) -> None:
+        self.pi = pi if pi is not None else PhonemeInventory.shared()
+        # Optional rule firing counter
+        self.counter = counter
 
     def get_split_tags(
         self,
@@ -20,15 +39,19 @@ class Syllabification:
         split_tags.append(True)
 
         glide_and_rhotic = {Phoneme.r.value, Phoneme.j.value, Phoneme.w.value}
+        counter = self.counter
 
         # 1. char based
         for i, char in enumerate(char_seq):
+            rule = None
             # Independent vowel, diphthongs and /H/
             if char in BN.in_diphthong_set | BN.main_set_V | {BN.h}:
+                rule = "independent_vowel"
                 if i > 0:
                     split_tags[i - 1] = True
             # dependent vowel and diphthongs
             elif char in BN.fi_set_V | BN.fi_diphthong_set:
+                rule = "dependent_vowel"
                 if i != last_idx and char in BN.fi_xu:
                     split_tags[i] = True
                 if i > 1:
@@ -39,6 +62,7 @@ class Syllabification:
                         split_tags[i - 2] = True
             # dependent consonants & xu
             elif char in BN.fi_set_C:
+                rule = "dependent_consonant"
                 if i != last_idx:
                     split_tags[i] = True
                 if i > 1:
@@ -50,6 +74,8 @@ class Syllabification:
             # Independent/main consonants
             else:
                 pass
+            if counter is not None:
+                counter.chain(CHAR_RULES, rule)
 
         # 2. phoneme + char based
         # Find invalid clusters and split them
@@ -59,9 +85,10 @@ class Syllabification:
 
                 if i > 0 and i < last_idx:
                     # 1. Invalid clusters
+                    rule = None
                     # Same phoneme
                     if phoneme_seq[i - 1] == phoneme_seq[i + 1]:
-                        split_tags[i] = True
+                        rule = "same_phoneme"
                     # VCCV
                     elif (
                         1 < i < last_idx - 1
@@ -73,7 +100,7 @@ class Syllabification:
                         in BN.fi_set_V.union(BN.fi_diphthong_set).difference(BN.fi_xu)
                         and phoneme_seq[i + 1] not in glide_and_rhotic
                     ):
-                        split_tags[i] = True
+                        rule = "vccv"
                     # IV + Nasal + Plosive
                     elif (
                         1 < i < last_idx - 1
@@ -81,13 +108,13 @@ class Syllabification:
                         and self.pi.get_sievers(phoneme_seq[i + 1]) == MoA.PLOSIVE
                         and char_seq[i - 2] in BN.main_set_V | BN.in_diphthong_set
                     ):
-                        split_tags[i] = True
+                        rule = "iv_nasal_plosive"
                     # plosive + plosive & plosive + nasal
                     elif self.pi.get_sievers(phoneme_seq[i - 1]) == MoA.PLOSIVE and (
                         self.pi.get_sievers(phoneme_seq[i + 1])
                         in {MoA.PLOSIVE, MoA.NASAL}
                     ):
-                        split_tags[i] = True
+                        rule = "plosive_plosive_nasal"
                     # dip in ssp and next phoneme being vowel is raised
                     # nasal + plosive + V
                     elif (
@@ -97,7 +124,7 @@ class Syllabification:
                         and phoneme_seq[i + 2]
                         in self.pi.phoneme_set_V | self.pi.phoneme_set_D
                     ):
-                        split_tags[i] = True
+                        rule = "nasal_plosive_v"
 
                     # glide + liquid
                     elif (
@@ -105,23 +132,36 @@ class Syllabification:
                         and self.pi.get_sievers(phoneme_seq[i - 1]) == Sievers.GLIDE
                         and self.pi.get_sievers(phoneme_seq[i + 1]) == Sievers.LIQUID
                     ):
+                        rule = "glide_liquid"
+
+                    if rule is not None:
                         split_tags[i] = True
+                    if counter is not None:
+                        counter.chain(INVALID_CLUSTER_RULES, rule)
 
                     # 2. Valid clusters
                     # split before when syllable initial consonant cluster is detected
                     if phoneme_seq[i + 1] in glide_and_rhotic:
+                        rule = None
                         if i > 3 and phoneme_seq[i - 3] == Phoneme.s.value:
+                            rule = "s_glide_rhotic_onset"
                             split_tags[i - 4] = True
                         elif i > 1:
+                            rule = "glide_rhotic_onset"
                             split_tags[i - 2] = True
+                        if counter is not None:
+                            counter.chain(ONSET_CLUSTER_RULES, rule)
 
                     # Split/cluster condition for cluster with L
-                    if (
+                    is_l_cluster = (
                         i > 2
                         and phoneme_seq[i + 1] == Phoneme.l.value
                         and char_seq[i - 2] in BN.fi_diphthong_set | BN.fi_set_V
-                    ):
+                    )
+                    if is_l_cluster:
                         split_tags[i] = True
+                    if counter is not None:
+                        counter.check("l_cluster", is_l_cluster)
                     # split after when syllable final consonant cluster is detected
 
         # Return split_points
@@ -0,0 +1,90 @@
+from typing import Dict, List
+
+from .conversion import PhonemeConvertor
+
+
+class TransliterationTrace:
+    """
+    Intermediate steps of transliterating a single word.
+
+    The pipeline stores the sequences it computes anyway; derived fields
+    (syllable phonemes, joined strings) are only built when accessed.
+
+    Attributes:
+        word (str): input word
+        cleaned (str): cleaned Bengali word
+        char_seq (List[str]): character sequence
+        phoneme_seq (List[str]): phoneme sequence
+        split_tags (List[bool]): split decision after every character
+        syl_chars (List[str]): syllables in Bengali
+        sup_phonemes (List[List[str]]): phoneme groups after `split_more`
+        output (str): word in Meetei Mayek
+    """
+
+    __slots__ = (
+        "word",
+        "cleaned",
+        "char_seq",
+        "phoneme_seq",
+        "split_tags",
+        "syl_chars",
+        "sup_phonemes",
+        "output",
+        "_syl_phonemes",
+    )
+
+    def __init__(
+        self,
+        word: str,
+        cleaned: str,
+        char_seq: List[str],
+        phoneme_seq: List[str],
+        split_tags: List[bool],
+        syl_chars: List[str],
+        sup_phonemes: List[List[str]],
+        output: str,
+    ) -> None:
+        self.word = word
+        self.cleaned = cleaned
+        self.char_seq = char_seq
+        self.phoneme_seq = phoneme_seq
+        self.split_tags = split_tags
+        self.syl_chars = syl_chars
+        self.sup_phonemes = sup_phonemes
+        self.output = output
+        self._syl_phonemes = None
+
+    @property
+    def syl_phonemes(self) -> List[str]:
+        """Phonemes of every syllable (joined by ".")."""
+        if self._syl_phonemes is None:
+            self._syl_phonemes = PhonemeConvertor.split_seq_by_bool(
+                self.phoneme_seq, self.split_tags, sep="."
+            )
+        return self._syl_phonemes
+
+    @property
+    def groups(self) -> List[str]:
+        """Phoneme groups after `split_more` (joined by ".")."""
+        return [".".join(phonemes) for phonemes in self.sup_phonemes]
+
+    def to_tsv(self, sep: str = "/", include_word: bool = False) -> str:
+        """Tab separated steps, same as `transliterate(word, show_steps=True)`."""
+        steps = (
+            f"{sep.join(self.syl_chars)}\t{sep.join(self.syl_phonemes)}\t"
+            f"{sep.join(self.groups)}\t{self.output}"
+            if self.syl_chars
+            else ""
+        )
+        return f"{self.word}\t{steps}" if include_word else steps
+
+    def to_dict(self) -> Dict[str, str | List[str]]:
+        return {
+            "word": self.word,
+            "cleaned": self.cleaned,
+            "split_tags": "".join("1" if tag else "0" for tag in self.split_tags),
+            "syllables": self.syl_chars,
+            "phonemes": self.syl_phonemes,
+            "groups": self.groups,
+            "output": self.output,
+        }
@@ -0,0 +1,206 @@
+from itertools import chain
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from ..lon_ import BN, Phoneme, PhonemeInventory, MoA, Sievers
+
+# Rule of the char based if/elif chain of Syllabification.get_split_tags
+NO_RULE, INDEPENDENT_VOWEL, DEPENDENT_VOWEL, DEPENDENT_CONSONANT = range(4)
+
+
+class Vocabulary(dict):
+    """Token -> ID, with the features of every token in a growing table.
+
+    ID 0 is padding (all features False).
+    """
+
+    def __init__(self, features: Callable[[str], Tuple]) -> None:
+        super().__init__()
+        self.features = features
+        self.rows: List[Tuple] = [(0,) * len(features(""))]
+        self.table: np.ndarray | None = None
+
+    def __missing__(self, token: str) -> int:
+        self[token] = len(self.rows)
+        self.rows.append(self.features(token))
+        self.table = None
+        return self[token]
+
+    def encode(self, seqs: Sequence[Sequence[str]], width: int) -> np.ndarray:
+        """Padded (len(seqs), width) matrix of token IDs."""
+        lengths = np.fromiter(map(len, seqs), dtype=np.int64, count=len(seqs))
+        ids = np.zeros((len(seqs), width), dtype=np.int32)
+        flat = np.fromiter(
+            map(self.__getitem__, chain.from_iterable(seqs)),
+            dtype=np.int32,
+            count=int(lengths.sum()),
+        )
+        ids[np.arange(width) < lengths[:, None]] = flat
+        return ids
+
+    def lookup(self, ids: np.ndarray) -> np.ndarray:
+        """(..., num_features) features of the IDs."""
+        if self.table is None:
+            self.table = np.array(self.rows, dtype=np.int8)
+        return self.table[ids]
+
+
+def back(a: np.ndarray, k: int) -> np.ndarray:
+    """a[:, i - k] at every position i (padding before the word start)."""
+    shifted = np.zeros_like(a)
+    shifted[:, k:] = a[:, : a.shape[1] - k]
+    return shifted
+
+
+def ahead(a: np.ndarray, k: int) -> np.ndarray:
+    """a[:, i + k] at every position i (padding after the last column)."""
+    shifted = np.zeros_like(a)
+    shifted[:, : a.shape[1] - k] = a[:, k:]
+    return shifted
+
+
+class BatchSyllabification:
+    """
+    Split tags of a batch of words at once, identical to
+    `Syllabification.get_split_tags` word by word.
+
+    The character and phoneme sequences are encoded as padded matrices of
+    token IDs. The features the rules test (character class, manner and
+    sonority of the phonemes, ...) are computed once per distinct token with
+    the same expressions as the per-word implementation, and every rule is
+    evaluated as boolean array operations over shifted neighbours.
+
+    Usage:
+        batch = BatchSyllabification()
+        # char_seqs and phoneme_seqs of PhonemeConvertor.extract_seq
+        split_tags = batch.get_split_tags(char_seqs, phoneme_seqs)
+        tags, lengths = batch.split_matrix(char_seqs, phoneme_seqs)  # arrays
+    """
+
+    def __init__(self, pi: PhonemeInventory | None = None) -> None:
+        self.pi = pi if pi is not None else PhonemeInventory.shared()
+        self.chars = Vocabulary(self.char_features)
+        self.phonemes = Vocabulary(self.phoneme_features)
+
+    @staticmethod
+    def char_features(char: str) -> Tuple:
+        if char in BN.in_diphthong_set | BN.main_set_V | {BN.h}:
+            rule = INDEPENDENT_VOWEL
+        elif char in BN.fi_set_V | BN.fi_diphthong_set:
+            rule = DEPENDENT_VOWEL
+        elif char in BN.fi_set_C:
+            rule = DEPENDENT_CONSONANT
+        else:
+            rule = NO_RULE
+        return (
+            rule,
+            char in BN.fi_xu,
+            char in BN.main_set_C,
+            char == BN.virama,
+            # VCCV: vowel before and dependent vowel after the cluster
+            char
+            in BN.main_set_V.union(
+                BN.in_diphthong_set, BN.fi_set_V, BN.fi_diphthong_set
+            ).difference(BN.fi_xu),
+            char in BN.fi_set_V.union(BN.fi_diphthong_set).difference(BN.fi_xu),
+            char in BN.main_set_V | BN.in_diphthong_set,
+            char in BN.fi_diphthong_set | BN.fi_set_V,
+        )
+
+    def phoneme_features(self, phoneme: str) -> Tuple:
+        pi = self.pi
+        return (
+            phoneme == BN.virama,
+            pi.get_sievers(phoneme) == MoA.NASAL,
+            pi.get_sievers(phoneme) == MoA.PLOSIVE,
+            pi.get_sievers(phoneme) in {MoA.PLOSIVE, MoA.NASAL},
+            phoneme in pi.phoneme_set_V | pi.phoneme_set_D,
+            pi.get_sievers(phoneme) == Sievers.GLIDE,
+            pi.get_sievers(phoneme) == Sievers.LIQUID,
+            phoneme in {Phoneme.r.value, Phoneme.j.value, Phoneme.w.value},
+            phoneme == Phoneme.s.value,
+            phoneme == Phoneme.l.value,
+        )
+
+    def split_matrix(
+        self,
+        char_seqs: Sequence[Sequence[str]],
+        phoneme_seqs: Sequence[Sequence[str]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Split tags as a padded (batch, max length + 1) boolean matrix and the
+        word lengths; tags[b, :lengths[b] + 1] are the tags of word b."""
+        lengths = np.fromiter(map(len, char_seqs), dtype=np.int64, count=len(char_seqs))
+        width = int(lengths.max(initial=0))
+        char_ids = self.chars.encode(char_seqs, width)
+        phoneme_ids = self.phonemes.encode(phoneme_seqs, width)
+        char_feats = self.chars.lookup(char_ids)
+        rule = char_feats[..., 0]
+        fi_xu, main_c, virama_c, vccv_before, vccv_after, iv, dependent_v = np.moveaxis(
+            char_feats[..., 1:], -1, 0
+        ).astype(bool)
+        phoneme_feats = self.phonemes.lookup(phoneme_ids)
+        virama, nasal, plosive, plosive_nasal, vowel = np.moveaxis(
+            phoneme_feats[..., :5], -1, 0
+        ).astype(bool)
+        glide, liquid, glide_rhotic, s, l = np.moveaxis(
+            phoneme_feats[..., 5:], -1, 0
+        ).astype(bool)
+
+        idx = np.arange(width)[None, :]
+        last = lengths[:, None] - 1
+        tags = np.zeros((len(char_seqs), width + 1), dtype=bool)
+        tags[np.arange(len(char_seqs)), lengths] = True
+        before_i = tags[:, :width]
+
+        def mark(cond: np.ndarray, k: int) -> None:
+            # split_tags[i - k] = True wherever cond holds at i
+            before_i[:, : width - k] |= cond[:, k:]
+
+        # 1. char based
+        not_last = idx != last
+        # dependent vowel/consonant after an unclustered main consonant
+        open_c = (idx > 1) & back(main_c, 1) & ~back(virama_c, 2)
+        independent = rule == INDEPENDENT_VOWEL
+        dependent = rule == DEPENDENT_VOWEL
+        consonant = rule == DEPENDENT_CONSONANT
+        mark(independent & (idx > 0), 1)
+        mark(dependent & not_last & fi_xu, 0)
+        mark(consonant & not_last, 0)
+        mark((dependent | consonant) & open_c, 2)
+
+        # 2. phoneme + char based (virama inside the word)
+        inner = virama & (idx > 0) & (idx < last)
+        middle = (idx > 1) & (idx < last - 1)
+        before_last = idx < last - 1
+        next_glide_rhotic = ahead(glide_rhotic, 1)
+        invalid = (
+            (back(phoneme_ids, 1) == ahead(phoneme_ids, 1))
+            | (
+                middle
+                & back(vccv_before, 2)
+                & ahead(vccv_after, 2)
+                & ~next_glide_rhotic
+            )
+            | (middle & back(nasal, 1) & ahead(plosive, 1) & back(iv, 2))
+            | (back(plosive, 1) & ahead(plosive_nasal, 1))
+            | (before_last & back(nasal, 1) & ahead(plosive, 1) & ahead(vowel, 2))
+            | (before_last & back(glide, 1) & ahead(liquid, 1))
+        )
+        l_cluster = (idx > 2) & ahead(l, 1) & back(dependent_v, 2)
+        mark(inner & (invalid | l_cluster), 0)
+        # Syllable initial cluster: split before it
+        onset = inner & next_glide_rhotic
+        s_onset = onset & (idx > 3) & back(s, 3)
+        mark(s_onset, 4)
+        mark(onset & ~s_onset & (idx > 1), 2)
+        return tags, lengths
+
+    def get_split_tags(
+        self,
+        char_seqs: Sequence[Sequence[str]],
+        phoneme_seqs: Sequence[Sequence[str]],
+    ) -> List[List[bool]]:
+        """Split tags of every word (as returned by get_split_tags)."""
+        tags, lengths = self.split_matrix(char_seqs, phoneme_seqs)
+        return [row[: length + 1] for row, length in zip(tags.tolist(), lengths)]
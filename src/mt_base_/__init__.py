@@ -1,4 +1,3 @@
 from .b2m import Baseline, BaselineExtended
 
-
 __all__ = ["Baseline", "BaselineExtended"]
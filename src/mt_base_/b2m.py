@@ -1,6 +1,7 @@
-from typing import Dict, Set
+from typing import Dict, List, Set, Tuple
 
 from ..lon_ import BN, MM, Cleaner
+from .transducer import CompiledPass, Transducer
 
 
 class Baseline:
@@ -112,11 +113,31 @@ class Baseline:
             for char_bn in char_bn_list
         }
         self.sorted_keys = sorted(self.charmap.keys(), key=len, reverse=True)
+        self.transducer = Transducer(self.rules())
+
+    @classmethod
+    def from_tables(
+        cls,
+        original_map: Dict[str, Set[str]],
+        charmap: Dict[str, str],
+        sorted_keys: List[str],
+        compiled: List[CompiledPass] | None = None,
+    ) -> "Baseline":
+        """Create a Baseline from precompiled tables and transducer passes (see
+        RuleSnapshot)."""
+        baseline = cls.__new__(cls)
+        baseline.original_map = original_map
+        baseline.charmap = charmap
+        baseline.sorted_keys = sorted_keys
+        baseline.transducer = Transducer(baseline.rules(), compiled=compiled)
+        return baseline
+
+    def rules(self) -> List[Tuple[str, str]]:
+        """Replacement rules in the order they are applied (longest keys first)."""
+        return [(key, self.charmap[key]) for key in self.sorted_keys]
 
     def transliterate(self, word_bn: str):
-        word_mm = word_bn
-        for key in self.sorted_keys:
-            word_mm = word_mm.replace(key, self.charmap[key])
+        word_mm = self.transducer.apply(word_bn)
         word_mm = Cleaner.filter_mm_utf(word_mm)
         return word_mm
 
@@ -140,16 +161,34 @@ class BaselineExtended:
             f"{bn.virama}{bn.la}": f"{mm.apun_iyek}{mm.lai}",
             f"{bn.virama}{bn.w}": f"{mm.apun_iyek}{mm.wai}",
         }
+        self.transducer = Transducer(self.rules())
+
+    @classmethod
+    def from_tables(
+        cls,
+        baseline: Baseline,
+        extra_charmap: Dict[str, str],
+        compiled: List[CompiledPass] | None = None,
+    ) -> "BaselineExtended":
+        """Create a BaselineExtended from precompiled tables and transducer
+        passes (see RuleSnapshot)."""
+        baseline_extended = cls.__new__(cls)
+        baseline_extended.baseline = baseline
+        baseline_extended.extra_charmap = extra_charmap
+        baseline_extended.transducer = Transducer(
+            baseline_extended.rules(), compiled=compiled
+        )
+        return baseline_extended
+
+    def rules(self) -> List[Tuple[str, str]]:
+        """Extra rules first, then the baseline rules."""
+        return [*self.extra_charmap.items(), *self.baseline.rules()]
 
     def transliterate(self, word_bn: str):
         # Deep Clean
         word_mm = Cleaner.deepclean_bn_utf(word_bn)
-        # Implement extra parts first
-        for key in self.extra_charmap:
-            word_mm = word_mm.replace(key, self.extra_charmap[key])
-        # Then implement the baseline
-        for key in self.baseline.sorted_keys:
-            word_mm = word_mm.replace(key, self.baseline.charmap[key])
+        # Implement extra parts first, then the baseline
+        word_mm = self.transducer.apply(word_mm)
 
         word_mm = Cleaner.filter_mm_utf(Cleaner.deepclean_mm_utf(word_mm))
         return word_mm
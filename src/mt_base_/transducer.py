@@ -0,0 +1,99 @@
+import re
+from typing import Callable, Dict, List, Tuple
+
+# Compiled pass: ("translate", str.maketrans table) or ("regex", source, mapping)
+CompiledPass = Tuple
+
+
+class Transducer:
+    """
+    Ordered replacement rules compiled into as few single-scan passes as possible.
+
+    `apply(text)` gives the same output as the sequential
+    `for key, value in rules: text = text.replace(key, value)`.
+
+    Consecutive rules share a pass as long as scanning the text once, taking
+    the longest key at every position, provably replaces the same spans:
+    - no value contains a character of a key of the pass (a replacement never
+      creates or hides a match of a later rule of the pass),
+    - no two keys overlap (a suffix of one is a prefix of the other),
+    - no key contains an earlier key of the pass (it would be replaced first),
+    - no multi-character rule of the pass deletes its key (the joined
+      neighbours could form a key that a single scan does not see again).
+    Passes of single characters run as `str.translate`, the others as one
+    regex alternation (longest keys first).
+
+    The compiled passes (`compiled`) are plain tables and regex sources, so
+    they can be stored (see RuleSnapshot) and given back to skip the grouping.
+
+    Usage:
+        transducer = Transducer([(key, charmap[key]) for key in sorted_keys])
+        transducer.apply(word)
+        Transducer(rules, compiled=transducer.compiled)  # restored as is
+    """
+
+    def __init__(
+        self,
+        rules: List[Tuple[str, str]],
+        compiled: List[CompiledPass] | None = None,
+    ) -> None:
+        self.rules = rules
+        if compiled is None:
+            groups: List[List[Tuple[str, str]]] = []
+            for key, value in rules:
+                if not groups or not Transducer.can_merge(groups[-1], key, value):
+                    groups.append([])
+                groups[-1].append((key, value))
+            compiled = [Transducer.compile_group(group) for group in groups]
+        self.compiled = compiled
+        self.passes: List[Callable[[str], str]] = [
+            Transducer.load_pass(compiled_pass) for compiled_pass in compiled
+        ]
+
+    @staticmethod
+    def overlaps(a: str, b: str) -> bool:
+        """Whether a proper suffix of one key is a proper prefix of the other."""
+        for size in range(1, min(len(a), len(b))):
+            if a[-size:] == b[:size] or b[-size:] == a[:size]:
+                return True
+        return False
+
+    @staticmethod
+    def can_merge(group: List[Tuple[str, str]], key: str, value: str) -> bool:
+        if (len(key) == 1) != (len(group[0][0]) == 1):
+            return False
+        if len(key) > 1 and (value == "" or any(v == "" for _, v in group)):
+            # A deletion joins its neighbours, which may form a later key
+            return False
+        key_chars = set(key).union(*(k for k, _ in group))
+        if key_chars & set(value).union(*(v for _, v in group)):
+            return False
+        return not any(k in key or Transducer.overlaps(k, key) for k, _ in group)
+
+    @staticmethod
+    def compile_group(group: List[Tuple[str, str]]) -> CompiledPass:
+        mapping = dict(group)
+        if all(len(key) == 1 for key in mapping):
+            return ("translate", str.maketrans(mapping))
+        keys = sorted(mapping, key=len, reverse=True)
+        return ("regex", "|".join(re.escape(key) for key in keys), mapping)
+
+    @staticmethod
+    def load_pass(compiled_pass: CompiledPass) -> Callable[[str], str]:
+        if compiled_pass[0] == "translate":
+            table: Dict[int, str] = compiled_pass[1]
+            return lambda text: text.translate(table)
+        _, source, mapping = compiled_pass
+        pattern = re.compile(source)
+        return lambda text: pattern.sub(lambda match: mapping[match.group()], text)
+
+    def apply(self, text: str) -> str:
+        for run_pass in self.passes:
+            text = run_pass(text)
+        return text
+
+    def apply_sequential(self, text: str) -> str:
+        """Reference: the rules one `str.replace` at a time."""
+        for key, value in self.rules:
+            text = text.replace(key, value)
+        return text
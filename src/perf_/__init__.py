@@ -0,0 +1,11 @@
+from .metrics import Histogram, StageMetrics, StageTimer
+from .rules import RuleCounter
+from .tail import TailSampler
+
+__all__ = [
+    "Histogram",
+    "RuleCounter",
+    "StageMetrics",
+    "StageTimer",
+    "TailSampler",
+]
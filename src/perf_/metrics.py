@@ -0,0 +1,166 @@
+from bisect import bisect_left
+from time import perf_counter
+from typing import Dict, Tuple
+
+# Upper bounds (le) of the histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    1e-2,
+)
+LENGTH_BUCKETS: Tuple[float, ...] = (1, 2, 4, 8, 12, 16, 24, 32, 64, 128)
+
+
+class Histogram:
+    """Fixed bucket histogram with running sum and count."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Dict[str, int]:
+        """Cumulative counts keyed by bucket upper bound (Prometheus `le`)."""
+        buckets, total = {}, 0
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts):
+            total += count
+            buckets[str(bound)] = total
+        return buckets
+
+
+class StageMetrics:
+    """
+    Per-stage timings and counters of a pipeline.
+
+    Every stage keeps its cumulative time, call count and latency histogram.
+    The input length distribution is kept in a separate histogram.
+
+    Usage:
+        metrics = StageMetrics("xlit_mt")
+        mt = MTransliteration(metrics=metrics)
+        ...
+        metrics.snapshot()  # dict
+        metrics.to_prometheus()  # text exposition format
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency_buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+        length_buckets: Tuple[float, ...] = LENGTH_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.latency_buckets = latency_buckets
+        self.length_buckets = length_buckets
+        self.reset()
+
+    def reset(self) -> None:
+        self.stages: Dict[str, Histogram] = {}
+        self.input_length = Histogram(self.length_buckets)
+
+    def timer(self, length: int) -> "StageTimer":
+        """Start timing one call with an input of `length` characters."""
+        return StageTimer(self, length)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = Histogram(self.latency_buckets)
+        histogram.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return the current metrics as a plain dictionary."""
+        return {
+            "stages": {
+                stage: {
+                    "count": histogram.count,
+                    "total_seconds": histogram.sum,
+                    "buckets": histogram.cumulative(),
+                }
+                for stage, histogram in self.stages.items()
+            },
+            "input_length": {
+                "count": self.input_length.count,
+                "total_chars": int(self.input_length.sum),
+                "buckets": self.input_length.cumulative(),
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        stage_metric = f"{self.name}_stage_seconds"
+        length_metric = f"{self.name}_input_length_chars"
+        lines = [
+            f"# HELP {stage_metric} Time spent in each pipeline stage.",
+            f"# TYPE {stage_metric} histogram",
+        ]
+        for stage, histogram in self.stages.items():
+            label = f'stage="{stage}"'
+            lines.extend(
+                f'{stage_metric}_bucket{{{label},le="{le}"}} {count}'
+                for le, count in histogram.cumulative().items()
+            )
+            lines.append(f"{stage_metric}_sum{{{label}}} {histogram.sum!r}")
+            lines.append(f"{stage_metric}_count{{{label}}} {histogram.count}")
+        lines.extend(
+            [
+                f"# HELP {length_metric} Length of the inputs in characters.",
+                f"# TYPE {length_metric} histogram",
+            ]
+        )
+        lines.extend(
+            f'{length_metric}_bucket{{le="{le}"}} {count}'
+            for le, count in self.input_length.cumulative().items()
+        )
+        lines.append(f"{length_metric}_sum {self.input_length.sum!r}")
+        lines.append(f"{length_metric}_count {self.input_length.count}")
+        return "\n".join(lines) + "\n"
+
+
+class StageTimer:
+    """Times consecutive stages of a single call.
+
+    The laps are kept in `laps` for the call itself (e.g. for tail sampling) and
+    are also recorded in `metrics` when given.
+    """
+
+    __slots__ = ("metrics", "start", "last", "laps")
+
+    def __init__(self, metrics: StageMetrics | None = None, length: int = 0) -> None:
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.input_length.observe(length)
+        self.laps: Dict[str, float] = {}
+        self.start = self.last = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Record the time since the previous lap as `stage`."""
+        now = perf_counter()
+        self.laps[stage] = now - self.last
+        if self.metrics is not None:
+            self.metrics.observe(stage, now - self.last)
+        self.last = now
+
+    def stop(self, stage: str = "total") -> float:
+        """Record and return the time since the start of the call as `stage`."""
+        seconds = perf_counter() - self.start
+        if self.metrics is not None:
+            self.metrics.observe(stage, seconds)
+        return seconds
@@ -0,0 +1,65 @@
+from collections import Counter
+from typing import Dict, Tuple
+
+
+class RuleCounter:
+    """
+    Counts how often each rule is tested and how often it fires.
+
+    Rules of an if/elif chain are recorded together with `chain()`: every rule
+    up to the one that fired has been tested. Independent rules are recorded
+    with `check()`. Comparing two counters with `diff()` shows whether two
+    engines take the same branches on the same corpus.
+
+    Usage:
+        rules = RuleCounter()
+        mt = MTransliteration(rules=rules)
+        ...
+        rules.snapshot()
+    """
+
+    def __init__(self) -> None:
+        self.tested: Counter = Counter()
+        self.fired: Counter = Counter()
+
+    def chain(self, rules: Tuple[str, ...], fired: str | None) -> None:
+        """Record an if/elif chain of `rules` where `fired` (or none) fired."""
+        num_tested = rules.index(fired) + 1 if fired is not None else len(rules)
+        self.tested.update(rules[:num_tested])
+        if fired is not None:
+            self.fired[fired] += 1
+
+    def check(self, rule: str, fired: bool) -> None:
+        """Record a single independent rule."""
+        self.tested[rule] += 1
+        if fired:
+            self.fired[rule] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int | float]]:
+        """Counts and firing rate per rule, hottest (most fired) first."""
+        return {
+            rule: {
+                "tested": tested,
+                "fired": self.fired[rule],
+                "rate": self.fired[rule] / tested,
+            }
+            for rule, tested in sorted(
+                self.tested.items(), key=lambda item: -self.fired[item[0]]
+            )
+        }
+
+    def diff(self, other: "RuleCounter") -> Dict[str, Tuple[Tuple[int, int], ...]]:
+        """Rules whose (tested, fired) counts differ between the two counters."""
+        return {
+            rule: (
+                (self.tested[rule], self.fired[rule]),
+                (other.tested[rule], other.fired[rule]),
+            )
+            for rule in sorted(self.tested.keys() | other.tested.keys())
+            if self.tested[rule] != other.tested[rule]
+            or self.fired[rule] != other.fired[rule]
+        }
+
+    def reset(self) -> None:
+        self.tested.clear()
+        self.fired.clear()
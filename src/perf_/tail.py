@@ -0,0 +1,65 @@
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, List
+
+
+class TailSampler:
+    """
+    Bounded ring buffer of the words slower than a latency threshold.
+
+    Every record holds the word, its length, the total latency, the per-stage
+    breakdown and the intermediate steps. When the buffer is full the oldest
+    record is dropped.
+
+    Usage:
+        tail = TailSampler(threshold=1e-3, capacity=1000)
+        mt = MTransliteration(tail=tail)
+        ...
+        tail.dump_jsonl("slow_words.jsonl")
+    """
+
+    def __init__(self, threshold: float = 1e-3, capacity: int = 1000) -> None:
+        """
+        Args:
+            threshold (float): latency threshold in seconds.
+            capacity (int): maximum number of records kept.
+        """
+        self.threshold = threshold
+        self.records: deque = deque(maxlen=capacity)
+        self.num_slow = 0  # Total slow words seen (including dropped records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def is_slow(self, seconds: float) -> bool:
+        return seconds >= self.threshold
+
+    def record(
+        self,
+        word: str,
+        seconds: float,
+        stages: Dict[str, float],
+        steps: Dict[str, str | List[str]],
+    ) -> None:
+        self.num_slow += 1
+        self.records.append(
+            {
+                "word": word,
+                "length": len(word),
+                "seconds": seconds,
+                "stages": dict(stages),
+                "steps": steps,
+            }
+        )
+
+    def dump_jsonl(self, file: str | Path, append: bool = False) -> int:
+        """Write the records to a JSONL file and return the number of records."""
+        with Path(file).open("a" if append else "w", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return len(self.records)
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.num_slow = 0
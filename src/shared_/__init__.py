@@ -0,0 +1,3 @@
+from .cache import SharedCache
+
+__all__ = ["SharedCache"]
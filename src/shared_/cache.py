@@ -0,0 +1,184 @@
+import struct
+import zlib
+from collections import Counter
+from hashlib import blake2b
+from multiprocessing import shared_memory
+from typing import Callable, Dict
+
+# Header: magic, version, capacity (slots), key size, value size, probes
+HEADER = struct.Struct("<4sHxxIHHI")
+# Slot: tag (hash of key and value, zero when empty), key length, value length
+SLOT = struct.Struct("<8sHH")
+# Key and value lengths, hashed in front of them
+LENGTHS = struct.Struct("<HH")
+MAGIC = b"XLSC"
+VERSION = 2
+EMPTY = bytes(8)
+
+
+def slot_tag(key: bytes, value: bytes) -> bytes:
+    """Hash of a slot. The lengths frame the key and value, so a torn slot
+    whose key/value boundary moved does not hash the same."""
+    lengths = LENGTHS.pack(len(key), len(value))
+    return blake2b(lengths + key + value, digest_size=8).digest()
+
+
+class SharedCache:
+    """
+    Word cache in shared memory, for worker pools.
+
+    An open-addressing hash table of UTF-8 keys and values in fixed-size
+    slots (`key_size` and `value_size` bytes, longer entries are not cached).
+    A key is looked up in `probes` consecutive slots starting at its CRC-32;
+    when they are all taken, one of them is evicted (round robin per process),
+    so the memory is bounded by `capacity` slots.
+
+    Processes read and write without locks. Every slot holds a 64-bit hash of
+    its key and value, written last; a lookup only returns a value whose hash
+    matches, so a slot being written by another process is a miss, never a
+    wrong value.
+
+    Usage:
+        with SharedCache.create(capacity=1 << 17) as cache:
+            Pool(jobs, initializer=init_worker, initargs=(cache.name,))
+        # in a worker
+        mt = MTransliteration(cache=SharedCache(name))
+        cache.stats()  # hits and pipeline runs of this process
+    """
+
+    def __init__(self, name: str, owner: bool = False) -> None:
+        self.shm = shared_memory.SharedMemory(name)
+        self.name = self.shm.name
+        # The owner unlinks the memory when closed
+        self.owner = owner
+        self.buf = self.shm.buf
+        magic, version, capacity, key_size, value_size, probes = HEADER.unpack_from(
+            self.buf, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{name} is not a version {VERSION} shared cache.")
+        self.capacity = capacity
+        self.key_size = key_size
+        self.value_size = value_size
+        self.probes = probes
+        self.slot_size = SLOT.size + key_size + value_size
+        self.reset()
+
+    @classmethod
+    def create(
+        cls,
+        capacity: int = 1 << 17,
+        key_size: int = 96,
+        value_size: int = 96,
+        probes: int = 8,
+        name: str | None = None,
+    ) -> "SharedCache":
+        """Allocate an empty cache (capacity is rounded up to a power of two)."""
+        capacity = 1 << max(capacity - 1, 1).bit_length()
+        slot_size = SLOT.size + key_size + value_size
+        shm = shared_memory.SharedMemory(
+            name, create=True, size=HEADER.size + capacity * slot_size
+        )
+        HEADER.pack_into(
+            shm.buf, 0, MAGIC, VERSION, capacity, key_size, value_size, probes
+        )
+        shm.close()
+        return cls(name or shm.name, owner=True)
+
+    def get(self, word: str, pipeline: Callable[[str], str]) -> str:
+        """Output of `word`, from the cache or from `pipeline`."""
+        word_mm = self.lookup(word)
+        if word_mm is not None:
+            self.paths["hit"] += 1
+            return word_mm
+        self.paths["pipeline"] += 1
+        word_mm = pipeline(word)
+        self.store(word, word_mm)
+        return word_mm
+
+    def lookup(self, word: str) -> str | None:
+        key = word.encode("utf-8")
+        buf, key_size = self.buf, self.key_size
+        index = zlib.crc32(key)
+        for probe in range(self.probes):
+            offset = self.__offset(index + probe)
+            tag, key_len, value_len = SLOT.unpack_from(buf, offset)
+            if tag == EMPTY:
+                return None
+            start = offset + SLOT.size
+            if key_len != len(key) or buf[start : start + key_len] != key:
+                continue
+            value = bytes(buf[start + key_size : start + key_size + value_len])
+            if slot_tag(key, value) != tag:
+                # Being written by another process
+                return None
+            return value.decode("utf-8")
+        return None
+
+    def store(self, word: str, word_mm: str) -> bool:
+        """Cache an output; False when the entry does not fit in a slot."""
+        key, value = word.encode("utf-8"), word_mm.encode("utf-8")
+        if len(key) > self.key_size or len(value) > self.value_size:
+            self.skipped += 1
+            return False
+        buf = self.buf
+        index = zlib.crc32(key)
+        for probe in range(self.probes):
+            offset = self.__offset(index + probe)
+            tag, key_len, _ = SLOT.unpack_from(buf, offset)
+            start = offset + SLOT.size
+            if tag == EMPTY or (
+                key_len == len(key) and buf[start : start + key_len] == key
+            ):
+                break
+        else:
+            offset = self.__offset(index + self.evictions % self.probes)
+            self.evictions += 1
+        # Clear the tag first so that readers never see a half-written slot
+        SLOT.pack_into(buf, offset, EMPTY, len(key), len(value))
+        start = offset + SLOT.size
+        buf[start : start + len(key)] = key
+        buf[start + self.key_size : start + self.key_size + len(value)] = value
+        buf[offset : offset + len(EMPTY)] = slot_tag(key, value)
+        return True
+
+    def __offset(self, index: int) -> int:
+        return HEADER.size + (index & (self.capacity - 1)) * self.slot_size
+
+    def __len__(self) -> int:
+        """Number of filled slots (scans the table)."""
+        size = len(EMPTY)
+        return sum(
+            self.buf[offset : offset + size] != EMPTY
+            for offset in map(self.__offset, range(self.capacity))
+        )
+
+    def stats(self) -> Dict[str, int | float]:
+        """Lookups of this process (every process keeps its own counters)."""
+        total = sum(self.paths.values())
+        return {
+            "hits": self.paths["hit"],
+            "pipeline": self.paths["pipeline"],
+            "hit_rate": self.paths["hit"] / total if total else 0.0,
+            "evictions": self.evictions,
+            "skipped": self.skipped,
+        }
+
+    def reset(self) -> None:
+        """Reset the counters of this process (the cached words are kept)."""
+        self.paths: Counter = Counter()
+        self.evictions = 0
+        self.skipped = 0
+
+    def close(self) -> None:
+        """Detach from the memory (and free it when this is the owner)."""
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self) -> "SharedCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,3 @@
+from .snapshot import RuleSnapshot
+
+__all__ = ["RuleSnapshot"]
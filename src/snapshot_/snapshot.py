@@ -0,0 +1,118 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Dict
+
+from ..gc_ import GlyphCorrection
+from ..lon_ import PhonemeInventory
+from ..mt_ import MTransliteration
+from ..mt_base_ import Baseline, BaselineExtended
+
+VERSION = 2
+# Sources of the compiled tables; editing any of them invalidates a snapshot
+SOURCES = [
+    Path(__file__).parent.parent / "lon_" / "phoneme.py",
+    Path(__file__).parent.parent / "lon_" / "bn.py",
+    Path(__file__).parent.parent / "lon_" / "mm.py",
+    Path(__file__).parent.parent / "mt_base_" / "b2m.py",
+    Path(__file__).parent.parent / "mt_base_" / "transducer.py",
+]
+
+
+def source_fingerprint() -> str:
+    sha1 = hashlib.sha1()
+    for source in SOURCES:
+        sha1.update(source.read_bytes())
+    return sha1.hexdigest()
+
+
+class RuleSnapshot:
+    """
+    Precompiled rule tables for instant engine construction.
+
+    Holds the phoneme inventory shared by every stage of MTransliteration and
+    the character maps and compiled transducer passes of the baselines, so
+    that engines are created without rebuilding them. Snapshots are versioned and store a fingerprint of the
+    sources they were compiled from.
+
+    Usage:
+        RuleSnapshot.compile().save("data/rules.pkl")  # build step
+        snapshot = RuleSnapshot.load("data/rules.pkl")
+        mt = snapshot.transliteration()
+        base1, base2 = snapshot.baseline(), snapshot.baseline_extended()
+    """
+
+    def __init__(self, tables: Dict[str, Any], fingerprint: str) -> None:
+        self.tables = tables
+        self.fingerprint = fingerprint
+        self.inventory: PhonemeInventory = tables["inventory"]
+
+    @classmethod
+    def compile(cls) -> "RuleSnapshot":
+        """Build all tables from the sources."""
+        baseline = Baseline()
+        baseline_extended = BaselineExtended()
+        tables = {
+            "inventory": PhonemeInventory(),
+            "baseline_map": baseline.original_map,
+            "baseline_charmap": baseline.charmap,
+            "baseline_sorted_keys": baseline.sorted_keys,
+            "baseline_passes": baseline.transducer.compiled,
+            "extended_charmap": baseline_extended.extra_charmap,
+            "extended_passes": baseline_extended.transducer.compiled,
+        }
+        return cls(tables, source_fingerprint())
+
+    def save(self, file: str | Path) -> None:
+        file = Path(file)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": VERSION, "fingerprint": self.fingerprint, **self.tables}
+        file.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @classmethod
+    def load(cls, file: str | Path, check: bool = True) -> "RuleSnapshot":
+        """Load a snapshot written by `save()` (only load trusted files).
+
+        Raises ValueError for other versions and, when `check` is set, for
+        snapshots compiled from different sources.
+        """
+        data = pickle.loads(Path(file).read_bytes())
+        if data.pop("version", None) != VERSION:
+            raise ValueError(f"{file} is not a version {VERSION} rule snapshot.")
+        fingerprint = data.pop("fingerprint")
+        if check and fingerprint != source_fingerprint():
+            raise ValueError(f"{file} is stale, compile the snapshot again.")
+        return cls(data, fingerprint)
+
+    @classmethod
+    def load_or_compile(cls, file: str | Path) -> "RuleSnapshot":
+        """Load the snapshot, (re)building it when missing or stale."""
+        try:
+            return cls.load(file)
+        except (FileNotFoundError, ValueError):
+            snapshot = cls.compile()
+            snapshot.save(file)
+            return snapshot
+
+    def transliteration(self, **kwargs) -> MTransliteration:
+        """MTransliteration using the snapshot inventory for all stages."""
+        return MTransliteration(pi=self.inventory, **kwargs)
+
+    def glyph_correction(self, **kwargs) -> GlyphCorrection:
+        # Glyph correction tables are module constants, nothing to rebuild
+        return GlyphCorrection(**kwargs)
+
+    def baseline(self) -> Baseline:
+        return Baseline.from_tables(
+            self.tables["baseline_map"],
+            self.tables["baseline_charmap"],
+            self.tables["baseline_sorted_keys"],
+            self.tables["baseline_passes"],
+        )
+
+    def baseline_extended(self) -> BaselineExtended:
+        return BaselineExtended.from_tables(
+            self.baseline(),
+            self.tables["extended_charmap"],
+            self.tables["extended_passes"],
+        )
@@ -0,0 +1,4 @@
+from .index import WordmapIndex
+from .lexicon import Lexicon
+
+__all__ = ["Lexicon", "WordmapIndex"]
@@ -0,0 +1,204 @@
+import mmap
+import shutil
+import struct
+import sys
+from array import array
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Tuple
+
+# Header: magic, version, byteorder flag, offset width (bytes), number of entries
+HEADER = struct.Struct("<4sHBBQ")
+MAGIC = b"XLWM"
+VERSION = 1
+LITTLE, BIG = 0, 1
+
+
+class WordmapIndex:
+    """
+    Compact binary wordmap with memory-mapped lookups.
+
+    Layout (after the header):
+    - key offsets (n + 1 unsigned integers, 32 bit unless a blob exceeds 4 GiB)
+    - value offsets (n + 1 unsigned integers)
+    - keys blob (UTF-8 keys sorted by their bytes, i.e. by code point)
+    - values blob (UTF-8 values in the same order)
+
+    Lookups binary search the keys directly in the mapped file, so opening
+    the index costs nothing and the pages are shared by every process that
+    maps the same file.
+
+    Usage:
+        WordmapIndex.write("wordmap.bin", wordmap)
+        with WordmapIndex("wordmap.bin") as index:
+            index.get(word_bn)
+    """
+
+    def __init__(self, file: str | Path) -> None:
+        self.file = Path(file)
+        with self.file.open("rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byteorder, width, self.size = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.file} is not a version {VERSION} wordmap index.")
+        if byteorder != (LITTLE if sys.byteorder == "little" else BIG):
+            raise ValueError(f"{self.file} was written with a different byte order.")
+        typecode = "I" if width == 4 else "Q"
+        offsets_size = (self.size + 1) * width
+        view = memoryview(self.mm)
+        start = HEADER.size
+        self.key_offsets = view[start : start + offsets_size].cast(typecode)
+        start += offsets_size
+        self.value_offsets = view[start : start + offsets_size].cast(typecode)
+        self.keys_start = start + offsets_size
+        self.values_start = self.keys_start + self.key_offsets[self.size]
+
+    @staticmethod
+    def write(
+        file: str | Path,
+        wordmap: Mapping[str, str] | Iterable[Tuple[str, str]],
+    ) -> int:
+        """Write a wordmap (mapping or (key, value) pairs) and return its size.
+
+        For repeated keys in pairs, the last value is kept (as in a dict).
+        """
+        items = wordmap.items() if isinstance(wordmap, Mapping) else wordmap
+        entries = sorted(
+            {key.encode("utf-8"): value.encode("utf-8") for key, value in items}.items()
+        )
+        blob_size = max(
+            sum(len(key) for key, _ in entries),
+            sum(len(value) for _, value in entries),
+        )
+        typecode = "I" if blob_size < 2**32 else "Q"
+        key_offsets, value_offsets = array(typecode, [0]), array(typecode, [0])
+        for key, value in entries:
+            key_offsets.append(key_offsets[-1] + len(key))
+            value_offsets.append(value_offsets[-1] + len(value))
+        byteorder = LITTLE if sys.byteorder == "little" else BIG
+        with Path(file).open("wb") as f:
+            f.write(
+                HEADER.pack(
+                    MAGIC, VERSION, byteorder, key_offsets.itemsize, len(entries)
+                )
+            )
+            f.write(key_offsets.tobytes())
+            f.write(value_offsets.tobytes())
+            f.writelines(key for key, _ in entries)
+            f.writelines(value for _, value in entries)
+        return len(entries)
+
+    @staticmethod
+    def write_sorted(file: str | Path, pairs: Iterable[Tuple[str, str]]) -> int:
+        """Stream (key, value) pairs sorted by key with unique keys (e.g. from
+        an external sort) to an index and return its size.
+
+        Offsets and blobs are spooled to temporary files next to `file`, so
+        memory use does not depend on the number of entries.
+        """
+        file = Path(file)
+        parts = ("key_offsets", "value_offsets", "keys", "values")
+        tmp_files = [file.with_name(f".{file.name}.{part}") for part in parts]
+        offset = struct.Struct("=Q")
+        size, key_end, value_end = 0, 0, 0
+        try:
+            with ExitStack() as stack:
+                key_offsets, value_offsets, keys, values = (
+                    stack.enter_context(tmp_file.open("wb")) for tmp_file in tmp_files
+                )
+                key_offsets.write(offset.pack(0))
+                value_offsets.write(offset.pack(0))
+                last = None
+                for key, value in pairs:
+                    key, value = key.encode("utf-8"), value.encode("utf-8")
+                    if last is not None and key <= last:
+                        raise ValueError("Keys must be sorted and unique.")
+                    last = key
+                    keys.write(key)
+                    values.write(value)
+                    key_end += len(key)
+                    value_end += len(value)
+                    key_offsets.write(offset.pack(key_end))
+                    value_offsets.write(offset.pack(value_end))
+                    size += 1
+            typecode = "I" if max(key_end, value_end) < 2**32 else "Q"
+            byteorder = LITTLE if sys.byteorder == "little" else BIG
+            with file.open("wb") as f:
+                f.write(
+                    HEADER.pack(
+                        MAGIC, VERSION, byteorder, array(typecode).itemsize, size
+                    )
+                )
+                # Offsets are narrowed to the final width block by block
+                for tmp_file in tmp_files[:2]:
+                    with tmp_file.open("rb") as offsets:
+                        while block := offsets.read(offset.size << 16):
+                            f.write(array(typecode, array("Q", block)).tobytes())
+                for tmp_file in tmp_files[2:]:
+                    with tmp_file.open("rb") as blob:
+                        shutil.copyfileobj(blob, f)
+        finally:
+            for tmp_file in tmp_files:
+                tmp_file.unlink(missing_ok=True)
+        return size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) >= 0
+
+    def __getitem__(self, key: str) -> str:
+        idx = self.find(key)
+        if idx < 0:
+            raise KeyError(key)
+        return self.value_at(idx)
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        idx = self.find(key)
+        return self.value_at(idx) if idx >= 0 else default
+
+    def find(self, key: str) -> int:
+        """Binary search the position of `key` (-1 when missing)."""
+        target = key.encode("utf-8")
+        mm, offsets, start = self.mm, self.key_offsets, self.keys_start
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = mm[start + offsets[mid] : start + offsets[mid + 1]]
+            if current < target:
+                lo = mid + 1
+            elif current > target:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def key_at(self, idx: int) -> str:
+        start = self.keys_start
+        return self.mm[
+            start + self.key_offsets[idx] : start + self.key_offsets[idx + 1]
+        ].decode("utf-8")
+
+    def value_at(self, idx: int) -> str:
+        start = self.values_start
+        return self.mm[
+            start + self.value_offsets[idx] : start + self.value_offsets[idx + 1]
+        ].decode("utf-8")
+
+    def keys(self) -> Iterator[str]:
+        return (self.key_at(idx) for idx in range(self.size))
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return ((self.key_at(idx), self.value_at(idx)) for idx in range(self.size))
+
+    def close(self) -> None:
+        self.key_offsets.release()
+        self.value_offsets.release()
+        self.mm.close()
+
+    def __enter__(self) -> "WordmapIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import Dict, Mapping, Tuple
+
+from .index import WordmapIndex
+
+
+class Lexicon:
+    """
+    Gold lexicon (e.g. data/transcribed.txt) with hit/miss counters.
+
+    Wraps a dict or a memory-mapped WordmapIndex. Used by MTransliteration in
+    lexicon-first mode: exact hits are returned as they are and only misses
+    go through the rule engine.
+
+    Usage:
+        lexicon = Lexicon.load("data/transcribed.bin")
+        mt = MTransliteration(lexicon=lexicon)
+        ...
+        lexicon.stats()
+    """
+
+    def __init__(self, wordmap: Mapping[str, str] | WordmapIndex) -> None:
+        self.wordmap = wordmap
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(
+        cls,
+        file: str | Path,
+        delimiter: str = "\t",
+        kv_field: Tuple[int, int] = (0, 1),
+    ) -> "Lexicon":
+        """Open a binary index (.bin) or read a delimited lexicon file."""
+        file = Path(file)
+        if file.suffix == ".bin":
+            return cls(WordmapIndex(file))
+        key_field, value_field = kv_field
+        wordmap: Dict[str, str] = {}
+        with file.open(encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split(delimiter)
+                if len(fields) > max(kv_field):
+                    wordmap[fields[key_field]] = fields[value_field]
+        return cls(wordmap)
+
+    def __len__(self) -> int:
+        return len(self.wordmap)
+
+    def get(self, word: str) -> str | None:
+        value = self.wordmap.get(word)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def stats(self) -> Dict[str, int | float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
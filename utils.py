@@ -1,11 +1,65 @@
+import bz2
 import csv
+import gzip
 import json
+import lzma
+import mmap
+import os
+import tempfile
+from collections import deque
+from contextlib import ExitStack
+from heapq import merge
+from itertools import groupby
 from pathlib import Path
-from typing import Collection, Dict, List, Tuple
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, TextIO, Tuple
 
+from src.wordmap_ import WordmapIndex
 
-def save_wordmap(wordmap: Dict[str, str], wordmap_file: str | Path):
-    """Save wordmap to .txt, .json, and .csv files."""
+# Compressed files, by suffix (e.g. words.txt.gz)
+compressors = {".gz": gzip, ".bz2": bz2, ".xz": lzma}
+# gzip defaults to level 9, about 3x slower than the level 6 of the gzip tool
+write_options = {".gz": {"compresslevel": 6}}
+
+
+# Compression
+def get_compression(file: str | Path) -> str:
+    """Compression suffix of a file ("" for plain files)."""
+    suffix = Path(file).suffix
+    return suffix if suffix in compressors else ""
+
+
+def open_text(
+    file: str | Path,
+    mode: str = "r",
+    compression: str | None = None,
+) -> TextIO:
+    """Open a UTF-8 text file, (de)compressed on the fly when its suffix (or
+    `compression`) is .gz, .bz2 or .xz."""
+    compression = get_compression(file) if compression is None else compression
+    if compression:
+        options = write_options.get(compression, {}) if mode != "r" else {}
+        return compressors[compression].open(
+            file, f"{mode}t", encoding="utf-8", **options
+        )
+    return Path(file).open(mode, encoding="utf-8")
+
+
+def resolve_file(file: str | Path) -> Path:
+    """`file` itself or, when it does not exist, its compressed version."""
+    file = Path(file)
+    if not file.exists():
+        for suffix in compressors:
+            if file.with_name(file.name + suffix).exists():
+                return file.with_name(file.name + suffix)
+    return file
+
+
+def save_wordmap(
+    wordmap: Dict[str, str],
+    wordmap_file: str | Path,
+    binary: bool = False,
+):
+    """Save wordmap to .txt, .json, and .csv files (and a binary .bin index)."""
     txt_path = Path(wordmap_file).with_suffix(".txt")
     txt_path.write_text(
         "\n".join([f"{word}\t{corrected}" for word, corrected in wordmap.items()]),
@@ -22,13 +76,92 @@ def save_wordmap(wordmap: Dict[str, str], wordmap_file: str | Path):
         for word1, word2 in wordmap.items():
             writer.writerow({"lang1": word1, "lang2": word2})
 
+    if binary:
+        WordmapIndex.write(Path(wordmap_file).with_suffix(".bin"), wordmap)
+
+
+def save_sorted_wordmap(
+    pairs: Iterable[Tuple[str, str]],
+    wordmap_file: str | Path,
+    binary: bool = False,
+) -> int:
+    """Stream (key, value) pairs sorted by key with unique keys to the same
+    files as `save_wordmap` and return the number of pairs.
+
+    Memory use does not depend on the size of the wordmap.
+    """
+    wordmap_file = Path(wordmap_file)
+    num_pairs = 0
+
+    def write_files() -> Iterator[Tuple[str, str]]:
+        nonlocal num_pairs
+        with ExitStack() as stack:
+            txt_file, json_file, csv_file = (
+                stack.enter_context(
+                    wordmap_file.with_suffix(suffix).open(
+                        "w", encoding="utf-8", newline=newline
+                    )
+                )
+                for suffix, newline in ((".txt", None), (".json", None), (".csv", ""))
+            )
+            writer = csv.DictWriter(csv_file, fieldnames=("lang1", "lang2"))
+            writer.writeheader()
+            json_file.write("{")
+            for word1, word2 in pairs:
+                if num_pairs:
+                    txt_file.write("\n")
+                    json_file.write(", ")
+                txt_file.write(f"{word1}\t{word2}")
+                json_file.write(
+                    f"{json.dumps(word1, ensure_ascii=False)}: "
+                    f"{json.dumps(word2, ensure_ascii=False)}"
+                )
+                writer.writerow({"lang1": word1, "lang2": word2})
+                num_pairs += 1
+                yield word1, word2
+            json_file.write("}")
+
+    if binary:
+        WordmapIndex.write_sorted(wordmap_file.with_suffix(".bin"), write_files())
+    else:
+        deque(write_files(), maxlen=0)
+    return num_pairs
+
+
+def build_wordmap_index(
+    file: str | Path,
+    index_file: str | Path,
+    delimiter: str = "\t",
+    kv_field: Tuple[int, int] = (0, 1),
+    tmp_dir: str | Path | None = None,
+) -> int:
+    """Build a binary wordmap index (see WordmapIndex) from a delimited file
+    and return its size.
+
+    The pairs are sorted externally (runs are spilled to `tmp_dir`, next to
+    the index by default) and streamed to the index, so memory use does not
+    depend on the size of the file. For repeated keys, the last value is kept
+    (as in a dict).
+    """
+    index_file = Path(index_file)
+    # NUL joins key and value: with other delimiters, keys may contain tabs
+    key = lambda line: line.split("\0", 1)[0]
+    with ExternalSorter(key=key, tmp_dir=tmp_dir or index_file.parent) as sorter:
+        sorter.extend(f"{k}\0{v}" for k, v in iter_dict(file, delimiter, kv_field))
+        last_pairs = (
+            deque(group, maxlen=1)[0].split("\0", 1)
+            for _, group in groupby(sorter, key=key)
+        )
+        return WordmapIndex.write_sorted(index_file, last_pairs)
+
 
 def read_list(
     file: str | Path,
     sort: bool = False,
 ) -> List[str]:
     """Read a file and return a list of lines."""
-    data = Path(file).read_text(encoding="utf-8").strip().split("\n")
+    with open_text(file) as f:
+        data = f.read().strip().split("\n")
     return sorted(data) if sort else data
 
 
@@ -38,9 +171,235 @@ def read_dict(
     kv_field: Tuple[int, int] = (0, 1),
 ) -> Dict[str, str]:
     """Read a file and return a dictionary."""
-    return str_to_dict(
-        Path(file).read_text(encoding="utf-8").strip(), delimiter, kv_field
-    )
+    with open_text(file) as f:
+        return str_to_dict(f.read().strip(), delimiter, kv_field)
+
+
+# Streaming
+def iter_lines(file: str | Path, encoding: str = "utf-8") -> Iterator[str]:
+    """Iterate over the lines of a memory-mapped (or compressed) file, without
+    line breaks."""
+    compression = get_compression(file)
+    if compression:
+        with compressors[compression].open(file, "rb") as f:
+            for line in f:
+                yield (line[:-1] if line.endswith(b"\n") else line).decode(encoding)
+        return
+    with Path(file).open("rb") as f:
+        if not Path(file).stat().st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                yield (line[:-1] if line.endswith(b"\n") else line).decode(encoding)
+
+
+def iter_chunks(
+    file: str | Path, size: int = 10000, encoding: str = "utf-8"
+) -> Iterator[List[str]]:
+    """Iterate over the non-empty lines of a file in chunks of `size` lines."""
+    chunk = []
+    for line in iter_lines(file, encoding=encoding):
+        if line:
+            chunk.append(line)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_rows(
+    file: str | Path,
+    delimiter: str = "\t",
+    columns: Tuple[int, ...] | None = None,
+) -> Iterator[Tuple[str, ...]]:
+    """Iterate over the delimited rows of a file, optionally selecting columns.
+
+    E.g. columns=(0, 1) on the 3-column data/transcribed.txt gives (word_bn, word_mm).
+    """
+    for line in iter_lines(file):
+        if not line:
+            continue
+        fields = line.split(delimiter)
+        yield tuple(fields[i] for i in columns) if columns else tuple(fields)
+
+
+def iter_dict(
+    file: str | Path,
+    delimiter: str = "\t",
+    kv_field: Tuple[int, int] = (0, 1),
+) -> Iterator[Tuple[str, str]]:
+    """Iterate over the (key, value) pairs of a delimited file."""
+    return iter_rows(file, delimiter, kv_field)
+
+
+def is_sorted(
+    file: str | Path,
+    delimiter: str = "\t",
+    column: int = 0,
+    strict: bool = True,
+) -> bool:
+    """Check (in one streaming pass) whether a file is sorted by `column`.
+
+    With `strict`, keys must also be unique.
+    """
+    last = None
+    for (key,) in iter_rows(file, delimiter, (column,)):
+        if last is not None and (key < last or (strict and key == last)):
+            return False
+        last = key
+    return True
+
+
+class LineWriter:
+    """
+    Buffered incremental writer of lines.
+
+    The lines are joined by "\n" (without a trailing line break) like `write_list`.
+    Files ending with .gz, .bz2 or .xz are compressed. With `atomic`, lines go
+    to a temporary file in the same directory which replaces `file` on a
+    successful close, so `file` is never left half written.
+
+    Usage:
+        with LineWriter("output.txt") as writer:
+            for line in lines:
+                writer.write(line)
+    """
+
+    def __init__(
+        self,
+        file: str | Path,
+        buffer_size: int = 10000,
+        atomic: bool = False,
+    ) -> None:
+        self.path = Path(file)
+        self.tmp_path = (
+            self.path.with_name(f".{self.path.name}.tmp") if atomic else None
+        )
+        self.file = open_text(
+            self.tmp_path or self.path, "w", compression=get_compression(self.path)
+        )
+        self.buffer_size = buffer_size
+        self.buffer: List[str] = []
+        self.num_lines = 0
+
+    def write(self, line: str) -> None:
+        self.buffer.append(line)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_all(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.file.write(("\n" if self.num_lines else "") + "\n".join(self.buffer))
+            self.num_lines += len(self.buffer)
+            self.buffer = []
+        self.file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+        if self.tmp_path is not None:
+            # Compressed streams are only complete once closed
+            with self.tmp_path.open("rb") as f:
+                os.fsync(f.fileno())
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard an atomic write (the target file is left untouched)."""
+        self.file.close()
+        if self.tmp_path is not None:
+            self.tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "LineWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is not None and self.tmp_path is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class ExternalSorter:
+    """
+    Sort more lines than fit in memory.
+
+    Lines are collected in runs of `run_size` lines. Every full run is sorted
+    and spilled to a temporary file, and iterating k-way merges the runs. The
+    sort is stable: lines with equal keys keep their insertion order.
+
+    Usage:
+        with ExternalSorter(key=lambda line: line.split("\t", 1)[0]) as sorter:
+            sorter.extend(lines)
+            for line in sorter:
+                ...
+    """
+
+    def __init__(
+        self,
+        run_size: int = 1000000,
+        key: Callable[[str], str] | None = None,
+        tmp_dir: str | Path | None = None,
+    ) -> None:
+        self.run_size = run_size
+        self.key = key
+        self.tmp_dir = tmp_dir
+        self.buffer: List[str] = []
+        self.runs: List[Path] = []
+        self.num_lines = 0
+        self._tmp: tempfile.TemporaryDirectory | None = None
+
+    def add(self, line: str) -> None:
+        self.buffer.append(line)
+        self.num_lines += 1
+        if len(self.buffer) >= self.run_size:
+            self.spill()
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.add(line)
+
+    def spill(self) -> None:
+        """Sort the buffered lines and write them to a new run."""
+        if not self.buffer:
+            return
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="xlit_", dir=self.tmp_dir)
+        run_file = Path(self._tmp.name) / f"run_{len(self.runs):06d}.txt"
+        self.buffer.sort(key=self.key)
+        with run_file.open("w", encoding="utf-8", newline="\n") as f:
+            f.writelines(f"{line}\n" for line in self.buffer)
+        self.runs.append(run_file)
+        self.buffer = []
+
+    def __iter__(self) -> Iterator[str]:
+        if not self.runs:
+            return iter(sorted(self.buffer, key=self.key))
+        self.spill()
+        return merge(*(self.__read_run(run) for run in self.runs), key=self.key)
+
+    @staticmethod
+    def __read_run(run_file: Path) -> Iterator[str]:
+        with run_file.open(encoding="utf-8", newline="\n") as f:
+            for line in f:
+                yield line[:-1]
+
+    def close(self) -> None:
+        """Remove the runs."""
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+        self.runs, self.buffer = [], []
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def write_list(
@@ -50,7 +409,8 @@ def write_list(
 ) -> None:
     """Write a list to a file."""
     data = "\n".join(sorted(data) if sort else list(data))
-    return Path(file).write_text(data, encoding="utf-8")
+    with open_text(file, "w") as f:
+        return f.write(data)
 
 
 def write_dict(
@@ -59,7 +419,33 @@ def write_dict(
     delimiter: str = "\t",
 ) -> None:
     """Write a dictionary to a file."""
-    Path(file).write_text(dict_to_str(data, delimiter), encoding="utf-8")
+    with open_text(file, "w") as f:
+        f.write(dict_to_str(data, delimiter))
+
+
+def write_traces(
+    file: str | Path,
+    traces: Iterable,
+    fmt: str | None = None,
+) -> int:
+    """Stream step traces to a TSV or JSONL file and return the number of traces.
+
+    The format is inferred from the file suffix (.jsonl, also compressed as
+    .jsonl.gz) unless `fmt` is given.
+    """
+    suffixes = Path(file).suffixes
+    if suffixes and get_compression(file):
+        suffixes = suffixes[:-1]
+    fmt = fmt or ("jsonl" if suffixes and suffixes[-1] == ".jsonl" else "tsv")
+    num_traces = 0
+    with open_text(file, "w") as f:
+        for trace in traces:
+            if fmt == "jsonl":
+                f.write(json.dumps(trace.to_dict(), ensure_ascii=False) + "\n")
+            else:
+                f.write(("\n" if num_traces else "") + trace.to_tsv(include_word=True))
+            num_traces += 1
+    return num_traces
 
 
 def str_to_dict(
@@ -68,9 +454,10 @@ def str_to_dict(
     kv_field: tuple[int, int] = (0, 1),
 ) -> Dict[str, str]:
     """Convert a delimited string to a dictionary."""
+    key_field, value_field = kv_field
     return {
-        line.split(delimiter)[kv_field[0]]: line.split(delimiter)[kv_field[1]]
-        for line in string.split("\n")
+        fields[key_field]: fields[value_field]
+        for fields in (line.split(delimiter) for line in string.split("\n"))
     }
 
 